@@ -0,0 +1,63 @@
+"""Payload size and render time for ArticleSerializer lists.
+
+Compares DRF's stdlib JSONRenderer with news.renderers.FastJSONRenderer and
+reports raw, gzip and (when installed) brotli sizes.
+
+    python -m benchmarks.api_payload --articles 200 --rounds 50
+"""
+import argparse
+import gzip
+import time
+
+from benchmarks.common import percentiles, print_table, scratch_db, setup_django, use_database
+from benchmarks.list_render import seed
+
+
+def run(articles=200, rounds=50):
+    from rest_framework.renderers import JSONRenderer
+    from news.models import Article
+    from news.renderers import FastJSONRenderer, orjson
+    from news.serializers import ArticleSerializer
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    use_database(scratch_db('api_payload'))
+    seed(articles)
+    rows = list(Article.objects.order_by('-published_date'))
+
+    def timed(fn):
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            result = fn()
+            samples.append(time.perf_counter() - started)
+        return result, percentiles(samples)
+
+    data, serialize = timed(lambda: ArticleSerializer(rows, many=True).data)
+    results = {'serialize': serialize}
+    for name, renderer in (('stdlib', JSONRenderer()), ('orjson' if orjson else 'fallback', FastJSONRenderer())):
+        body, stats = timed(lambda renderer=renderer: renderer.render(data))
+        results[name] = {**stats, 'bytes': len(body)}
+
+    sizes = {'raw': len(body), 'gzip': len(gzip.compress(body, compresslevel=6))}
+    if brotli is not None:
+        sizes['brotli'] = len(brotli.compress(body, quality=5))
+    results['payload'] = sizes
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('API payload', run(args.articles, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Sync (WSGI threads) vs async (ASGI event loop) throughput for audio
+generation while the TTS engine is slow.
+
+    python -m benchmarks.async_tts --requests 40 --workers 4 --tts-delay 0.2
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import print_table, scratch_db, setup_django, use_database
+
+
+def seed():
+    from django.contrib.auth.models import User
+    from news.models import Article, Category
+
+    category = Category.objects.create(name='General')
+    article = Article.objects.create(title='Bench', content='Body ' * 200, summary='Short summary.',
+                                     approved=True, category=category)
+    user = User.objects.create_user(username='bench', password='bench')
+    return article, user
+
+
+def run_sync(article, user, requests, workers):
+    from django.db import connections
+    from django.test import Client
+
+    url = f'/news/article/{article.pk}/ajax/generate-audio/'
+
+    def hit(_):
+        client = Client()
+        client.force_login(user)
+        status = client.post(url).status_code
+        connections.close_all()
+        return status
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(hit, range(requests)))
+    return started, statuses
+
+
+def run_async(article, user, requests):
+    from django.test import AsyncClient
+
+    url = f'/api/async/articles/{article.pk}/generate-audio/'
+
+    async def main():
+        client = AsyncClient()
+        await client.aforce_login(user)
+        return await asyncio.gather(*(client.post(url) for _ in range(requests)))
+
+    started = time.perf_counter()
+    responses = asyncio.run(main())
+    return started, [response.status_code for response in responses]
+
+
+def run(requests=40, workers=4, tts_delay=0.2):
+    from django.conf import settings
+
+    settings.MEDIA_ROOT = tempfile.mkdtemp(prefix='bytenews-media-')
+    settings.NEWS_TTS_CLIENT = {'BACKEND': 'news.tts.FakeTTSClient', 'OPTIONS': {'delay': tts_delay}}
+    use_database(scratch_db('async_tts'))
+    article, user = seed()
+
+    results = {}
+    for name, runner in (('wsgi_sync', lambda: run_sync(article, user, requests, workers)),
+                         ('asgi_async', lambda: run_async(article, user, requests))):
+        started, statuses = runner()
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            'requests': requests,
+            'errors': sum(status != 200 for status in statuses),
+            'seconds': elapsed,
+            'req_per_s': requests / elapsed,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=4, help='WSGI worker threads')
+    parser.add_argument('--tts-delay', type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('Audio generation under slow TTS', run(args.requests, args.workers, args.tts_delay))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup_django(db_path=None):
+    """Configure Django against a scratch SQLite file so benchmarks never touch db.sqlite3."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bytenews.settings')
+
+    import django
+    from django.conf import settings
+
+    if db_path is None:
+        db_path = Path(tempfile.mkdtemp(prefix='bytenews-bench-')) / 'bench.sqlite3'
+    settings.DATABASES['default']['NAME'] = str(db_path)
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = ['testserver', 'localhost', '127.0.0.1']
+    django.setup()
+    return db_path
+
+
+def scratch_db(name):
+    return Path(tempfile.mkdtemp(prefix='bytenews-bench-')) / f'{name}.sqlite3'
+
+
+def use_database(db_path, migrate=True):
+    """Point the default alias at ``db_path`` and build the schema there."""
+    from django.core.management import call_command
+    from django.db import connections
+
+    connections.close_all()
+    connections.settings['default']['NAME'] = str(db_path)
+    if migrate:
+        call_command('migrate', verbosity=0)
+
+
+def percentiles(samples):
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        'count': len(ordered),
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': pick(0.50) * 1000,
+        'p95_ms': pick(0.95) * 1000,
+        'p99_ms': pick(0.99) * 1000,
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    for name, stats in rows.items():
+        cells = '  '.join(
+            f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in stats.items()
+        )
+        print(f"  {name:<12} {cells}")
@@ -0,0 +1,69 @@
+"""Offline fixtures: deterministic article text and a local feed server."""
+import random
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = (
+    "the council market energy policy climate research team league court health city school water "
+    "report data growth price vote plan minister study players season company workers trial storm"
+).split()
+
+
+def sentence(rng, words=18):
+    text = ' '.join(rng.choices(WORDS, k=words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def article_text(rng, sentences):
+    return ' '.join(sentence(rng, rng.randint(10, 28)) for _ in range(sentences))
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        if self.path.startswith('/feed/'):
+            source = self.path.rsplit('/', 1)[1]
+            items = ''.join(
+                f"<item><title>{source} story {n}</title><link>{server.base}/article/{source}/{n}</link>"
+                f"<description>{sentence(random.Random(n))}</description></item>"
+                for n in range(server.entries)
+            )
+            body = f"<rss version='2.0'><channel><title>{source}</title>{items}</channel></rss>"
+            content_type = 'application/rss+xml'
+        elif self.path.startswith('/article/'):
+            rng = random.Random(self.path)
+            paragraphs = ''.join(f"<p>{article_text(rng, 4)}</p>" for _ in range(server.paragraphs))
+            body = f"<html><head><title>{self.path}</title></head><body><article>{paragraphs}</article></body></html>"
+            content_type = 'text/html; charset=utf-8'
+        else:
+            self.send_error(404)
+            return
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@contextmanager
+def feed_server(sources=4, entries=3, paragraphs=8):
+    """Serve ``sources`` RSS feeds on localhost; yields a NEWS_SOURCES-style dict."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FeedHandler)
+    server.daemon_threads = True
+    server.base = f"http://127.0.0.1:{server.server_port}"
+    server.entries = entries
+    server.paragraphs = paragraphs
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield {f"Source {i}": f"{server.base}/feed/source{i}" for i in range(sources)}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,93 @@
+"""record_reading under concurrent readers: direct INSERT vs write-behind.
+
+    python -m benchmarks.history_writes --threads 8 --events 400
+"""
+import argparse
+import random
+import threading
+import time
+
+from benchmarks.common import percentiles, print_table, scratch_db, setup_django, use_database
+
+
+def seed(users, articles):
+    from django.contrib.auth.models import User
+    from news.models import Article, Category
+
+    category = Category.objects.create(name='General')
+    Article.objects.bulk_create(
+        Article(title=f"Article {i}", content="Body", approved=True, category=category,
+                link=f"https://history.example/{i}")
+        for i in range(articles)
+    )
+    User.objects.bulk_create(User(username=f"reader{i}") for i in range(users))
+    return list(User.objects.all()), list(Article.objects.only('id'))
+
+
+def run_mode(write_behind, threads, events, users=50, articles=500):
+    from django.conf import settings
+    from django.db import OperationalError, connections
+    from news import history
+    from news.models import ReadingHistory
+
+    settings.READING_HISTORY_WRITE_BEHIND = write_behind
+    history._recorder = None
+    use_database(scratch_db('history'))
+    readers, stories = seed(users, articles)
+    connections.close_all()
+
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        local = []
+        for _ in range(events):
+            started = time.perf_counter()
+            try:
+                history.record_reading(rng.choice(readers), rng.choice(stories))
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+        connections.close_all()
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    if write_behind:
+        history.get_recorder().flush()
+    elapsed = time.perf_counter() - started
+
+    stats = percentiles(latencies)
+    stats['errors'] = errors[0]
+    stats['events_per_s'] = threads * events / elapsed
+    stats['rows'] = ReadingHistory.objects.count()
+    return stats
+
+
+def run(threads=8, events=400):
+    return {
+        'direct': run_mode(False, threads, events),
+        'write_behind': run_mode(True, threads, events),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--events', type=int, default=400, help='record_reading calls per thread')
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('Reading-history writes', run(args.threads, args.events))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Feed-summary HTML extraction: BeautifulSoup tree vs news.text.html_to_text.
+
+    python -m benchmarks.html_extract --entries 2000
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from benchmarks.common import print_table, setup_django
+
+WORDS = "markets policy climate election research startup league court energy health".split()
+
+
+def make_entry(rng):
+    paragraphs = ''.join(
+        f"<p>{' '.join(rng.choices(WORDS, k=40))} &amp; <a href=\"https://example.com/{rng.randint(1, 9999)}\">more</a>"
+        f" <b>{rng.choice(WORDS)}</b>&nbsp;&#8212; {' '.join(rng.choices(WORDS, k=20))}</p>"
+        for _ in range(rng.randint(3, 12))
+    )
+    return (
+        f"<div class=\"feed\"><img src=\"https://cdn.example.com/{rng.randint(1, 9999)}.jpg\" alt=\"\">"
+        f"<script>var t = {rng.random()};</script>{paragraphs}<!-- tracking --></div>"
+    )
+
+
+def measure(extract, entries):
+    tracemalloc.start()
+    started = time.perf_counter()
+    for html in entries:
+        extract(html)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    total_mb = sum(len(html) for html in entries) / 1e6
+    return {
+        'entries_per_s': len(entries) / elapsed,
+        'mb_per_s': total_mb / elapsed,
+        'peak_kb': peak / 1024,
+    }
+
+
+def run(entries=2000, seed=42):
+    from bs4 import BeautifulSoup
+    from news.text import html_to_text
+
+    rng = random.Random(seed)
+    corpus = [make_entry(rng) for _ in range(entries)]
+    for html in corpus[:50]:
+        assert html_to_text(html) == BeautifulSoup(html, 'html.parser').get_text(separator=' ', strip=True)
+
+    return {
+        'bs4': measure(lambda html: BeautifulSoup(html, 'html.parser').get_text(separator=' ', strip=True), corpus),
+        'streaming': measure(html_to_text, corpus),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('HTML extraction', run(args.entries))
+
+
+if __name__ == '__main__':
+    main()
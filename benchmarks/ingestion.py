@@ -0,0 +1,57 @@
+"""scrape_news end to end against a local fixture feed server.
+
+"cold" runs start from an empty database; "warm" runs repeat on the
+populated one, where stored links are skipped before any download.
+
+    python -m benchmarks.ingestion --sources 8 --entries 3
+"""
+import argparse
+import io
+import time
+
+from benchmarks.common import print_table, scratch_db, setup_django, use_database
+from benchmarks.fixtures import feed_server
+
+
+def run(sources=8, entries=3, rounds=3):
+    from django.conf import settings
+    from django.core.management import call_command
+    from news.fetch import reset_fetcher
+
+    def timed_scrape():
+        started = time.perf_counter()
+        call_command('scrape_news', '--no-report', stdout=io.StringIO())
+        return time.perf_counter() - started
+
+    results = {}
+    with feed_server(sources=sources, entries=entries) as news_sources:
+        settings.NEWS_SOURCES = news_sources
+        reset_fetcher(setting='NEWS_FETCH')
+        cold = []
+        for _ in range(rounds):
+            use_database(scratch_db('ingestion'))
+            cold.append(timed_scrape())
+        warm = [timed_scrape() for _ in range(rounds)]
+
+    for name, timings in (('cold', cold), ('warm', warm)):
+        results[name] = {
+            'sources': sources,
+            'seconds': min(timings),
+            'sources_per_s': sources / min(timings),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sources', type=int, default=8)
+    parser.add_argument('--entries', type=int, default=3)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('scrape_news (local feeds)', run(args.sources, args.entries, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
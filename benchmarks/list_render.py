@@ -0,0 +1,63 @@
+"""Article list render time with a cold and a warm fragment cache.
+
+    python -m benchmarks.list_render --articles 2000 --rounds 30
+"""
+import argparse
+import time
+
+from benchmarks.common import percentiles, print_table, scratch_db, setup_django, use_database
+
+
+def seed(count):
+    from django.utils import timezone
+    from news.models import Article, Category
+    from news.text import build_teaser, estimate_reading_time
+
+    categories = [Category.objects.create(name=f"Category {i}") for i in range(12)]
+    content = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 300
+    Article.objects.bulk_create(
+        Article(title=f"Article {i}", content=content, teaser=build_teaser(content),
+                reading_time=estimate_reading_time(content), approved=True,
+                category=categories[i % len(categories)], link=f"https://bench.example/{i}",
+                source_url=f"https://bench.example/{i}", source='Bench',
+                published_date=timezone.now())
+        for i in range(count)
+    )
+
+
+def run(articles=2000, rounds=30):
+    from django.core.cache import cache
+    from django.test import Client
+
+    use_database(scratch_db('list_render'))
+    seed(articles)
+    client = Client()
+    url = '/news/?page=2'
+
+    def render(clear):
+        samples = []
+        for _ in range(rounds):
+            if clear:
+                cache.clear()
+            started = time.perf_counter()
+            response = client.get(url)
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 200
+        return percentiles(samples)
+
+    client.get(url)  # compile templates once
+    return {'cold': render(clear=True), 'warm': render(clear=False)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=30)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('Article list render', run(args.articles, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
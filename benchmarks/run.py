@@ -0,0 +1,165 @@
+"""Run the benchmark suite, write JSON and compare against a baseline.
+
+Every suite runs in its own interpreter (suites change settings and point
+the default database at scratch files), fully offline.
+
+    python -m benchmarks.run --quick --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run --suite views --suite ingestion --save-baseline benchmarks/baseline.json
+
+Exit status is 1 when any metric regressed past the threshold.
+"""
+import argparse
+import importlib
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.common import ROOT
+
+# suite -> (module, full-size kwargs, --quick kwargs)
+SUITES = {
+    'summarizer': ('benchmarks.summarizer', {'articles': 50}, {'articles': 10}),
+    'ingestion': ('benchmarks.ingestion', {'sources': 8, 'rounds': 3}, {'sources': 4, 'rounds': 1}),
+    'views': ('benchmarks.views', {'articles': 100_000, 'rounds': 30}, {'articles': 10_000, 'rounds': 10}),
+    'list_render': ('benchmarks.list_render', {'articles': 2000, 'rounds': 30}, {'articles': 500, 'rounds': 10}),
+    'api_payload': ('benchmarks.api_payload', {'articles': 200, 'rounds': 50}, {'articles': 50, 'rounds': 10}),
+    'history_writes': ('benchmarks.history_writes', {'threads': 8, 'events': 400}, {'threads': 4, 'events': 100}),
+    'sqlite_concurrency': ('benchmarks.sqlite_concurrency', {'readers': 8, 'seconds': 5}, {'readers': 4, 'seconds': 1}),
+    'tts': ('benchmarks.async_tts', {'requests': 40, 'workers': 4, 'tts_delay': 0.2},
+            {'requests': 10, 'workers': 2, 'tts_delay': 0.05}),
+    'html_extract': ('benchmarks.html_extract', {'entries': 2000}, {'entries': 300}),
+    'startup': ('benchmarks.startup', {'rounds': 3}, {'rounds': 1}),
+}
+
+# Metric name suffix -> which direction is better.
+LOWER_IS_BETTER = ('_ms', 'seconds', 'bytes', 'errors', 'peak_kb', 'rss_mb')
+HIGHER_IS_BETTER = ('_per_s',)
+IGNORED_METRICS = ('max_ms',)  # a single outlier; p95/p99 carry the tail
+NOISE_FLOOR_MS = 1.0  # sub-millisecond timing swings are never flagged
+
+
+def run_suite(name, quick):
+    module, full, small = SUITES[name]
+    kwargs = small if quick else full
+    proc = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.run', '--child', name, '--kwargs', json.dumps(kwargs)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return {'error': proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f'exit {proc.returncode}'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def child(name, kwargs):
+    from benchmarks.common import setup_django
+
+    module = importlib.import_module(SUITES[name][0])
+    if name != 'startup':
+        setup_django()
+    print(json.dumps(module.run(**kwargs), default=str))
+
+
+def flatten(results):
+    """``{suite: {case: {metric: value}}}`` -> ``{"suite.case.metric": value}`` (numbers only)."""
+    def is_number(value):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    flat = {}
+    for suite, cases in results.items():
+        for case, metrics in cases.items():
+            if is_number(metrics):  # single-case suites such as startup
+                flat[f"{suite}.{case}"] = metrics
+            elif isinstance(metrics, dict):
+                for metric, value in metrics.items():
+                    if is_number(value):
+                        flat[f"{suite}.{case}.{metric}"] = value
+    return flat
+
+
+def compare(current, baseline, threshold):
+    """Rows of ``(key, baseline, current, change, regressed)`` for directional metrics."""
+    rows = []
+    now, before = flatten(current), flatten(baseline)
+    for key in sorted(now.keys() & before.keys()):
+        metric = key.rsplit('.', 1)[1]
+        if metric in IGNORED_METRICS:
+            continue
+        if metric.endswith(HIGHER_IS_BETTER):
+            sign = -1
+        elif metric.endswith(LOWER_IS_BETTER):
+            sign = 1
+        else:
+            continue
+        old, new = before[key], now[key]
+        if old == 0:
+            change = 0.0 if new == 0 else float('inf')
+        else:
+            change = (new - old) / abs(old)
+        noise = metric.endswith('_ms') and abs(new - old) < NOISE_FLOOR_MS
+        rows.append((key, old, new, change, sign * change > threshold and not noise))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES), help='Run only these (repeatable).')
+    parser.add_argument('--quick', action='store_true', help='Small sizes for a fast smoke run.')
+    parser.add_argument('--output', type=Path, help='Write results JSON here.')
+    parser.add_argument('--baseline', type=Path, help='Compare against this results JSON.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed relative slowdown (0.2 = 20%%).')
+    parser.add_argument('--save-baseline', type=Path, help='Also write the results as the new baseline.')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--kwargs', default='{}', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, json.loads(args.kwargs))
+        return
+
+    document = {
+        'meta': {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+        },
+        'results': {},
+    }
+    for name in args.suite or SUITES:
+        print(f"▶ {name}...", flush=True)
+        started = time.perf_counter()
+        document['results'][name] = run_suite(name, args.quick)
+        print(f"  done in {time.perf_counter() - started:.1f}s", flush=True)
+
+    body = json.dumps(document, indent=2)
+    for path in filter(None, (args.output, args.save_baseline)):
+        path.write_text(body)
+        print(f"📝 Wrote {path}")
+
+    failed = [name for name, result in document['results'].items() if 'error' in result]
+    for name in failed:
+        print(f"❌ {name}: {document['results'][name]['error']}")
+
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline['meta'].get('quick') != args.quick:
+            print("⚠️ Baseline was recorded with a different --quick setting; sizes differ.")
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        for key, old, new, change, regressed in compare(document['results'], baseline['results'], args.threshold):
+            marker = '❌' if regressed else '  '
+            print(f"{marker} {key:<48} {old:>12.2f} -> {new:>12.2f} ({change:+.0%})")
+            if regressed:
+                regressions.append(key)
+        print(f"\n{len(regressions)} regression(s).")
+
+    if failed or regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
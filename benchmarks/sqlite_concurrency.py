@@ -0,0 +1,123 @@
+"""Reader tail latency while scrape_news writes, with and without SQLITE_PRAGMAS.
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --seconds 5
+"""
+import argparse
+import io
+import itertools
+import threading
+import time
+from unittest import mock
+
+from benchmarks.common import percentiles, print_table, scratch_db, setup_django, use_database
+
+
+def seed(count):
+    from django.utils import timezone
+    from news.models import Article, Category
+
+    category = Category.objects.create(name='General')
+    Article.objects.bulk_create(
+        Article(title=f"Seed {i}", content="Lorem ipsum " * 200, approved=True,
+                category=category, link=f"https://seed.example/{i}",
+                source_url=f"https://seed.example/{i}", published_date=timezone.now())
+        for i in range(count)
+    )
+
+
+def fake_feed(counter):
+    from django.utils import timezone
+
+    def fetch(feed_url, source_name):
+        n = next(counter)
+        return [{
+            'title': f"{source_name} story {n}",
+            'link': f"https://ingest.example/{n}",
+            'source': source_name,
+            'content': "Breaking news " * 400,
+            'publication_date': timezone.now(),
+        }]
+    return fetch
+
+
+def run_mode(pragmas, db_path, readers, seconds):
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import OperationalError, connections
+    from news.models import Article
+
+    settings.SQLITE_PRAGMAS = pragmas
+    use_database(db_path)
+    seed(2000)
+    connections.close_all()
+
+    stop = threading.Event()
+    latencies, errors, writes = [], [0], [0]
+    lock = threading.Lock()
+
+    def reader():
+        local = []
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                list(Article.objects.filter(approved=True).select_related('category')
+                     .order_by('-published_date')[:6])
+                Article.objects.filter(approved=True).count()
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+                continue
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+        connections.close_all()
+
+    def writer():
+        counter = itertools.count()
+        with mock.patch('news.management.commands.scrape_news.fetch_news_from_rss', fake_feed(counter)):
+            while not stop.is_set():
+                try:
+                    call_command('scrape_news', no_report=True, stdout=io.StringIO())
+                    writes[0] += 1
+                except OperationalError:
+                    with lock:
+                        errors[0] += 1
+        connections.close_all()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    stats = percentiles(latencies)
+    stats['errors'] = errors[0]
+    stats['scrape_runs'] = writes[0]
+    return stats
+
+
+def run(readers=8, seconds=5.0):
+    from django.conf import settings
+
+    tuned = dict(settings.SQLITE_PRAGMAS)
+    return {
+        'default': run_mode({}, scratch_db('default'), readers, seconds),
+        'tuned': run_mode(tuned, scratch_db('tuned'), readers, seconds),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('SQLite readers alongside scrape_news', run(args.readers, args.seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Worker boot time, RSS and import profile, with budgets.
+
+Boots a fresh interpreter the way a web worker does (``django.setup()``
+plus loading the URLconf, which imports every view module) under
+``python -X importtime`` and fails if the budgets are exceeded or a heavy
+NLP/scraping module got imported.
+
+    python -m benchmarks.startup --max-boot-ms 1500 --max-rss-mb 120
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.common import ROOT
+
+HEAVY_MODULES = ('nltk', 'newspaper', 'feedparser', 'bs4', 'gtts', 'pandas')
+
+BOOT = """
+import json, resource, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+boot_ms = (time.perf_counter() - started) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+heavy = sorted(name for name in sys.modules if name.split('.')[0] in %r)
+print(json.dumps({'boot_ms': boot_ms, 'rss_mb': rss_kb / 1024, 'heavy': sorted({n.split('.')[0] for n in heavy})}))
+""" % (HEAVY_MODULES,)
+
+
+def parse_importtime(stderr, top=15):
+    """Top-level packages by cumulative import time (microseconds)."""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nested imports are indented; top-level entries carry their subtree's cost.
+        if cumulative_us.strip().isdigit() and not name[1:].startswith(' '):
+            totals[name.strip()] = int(cumulative_us)
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+
+
+def run(rounds=3):
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'bytenews.settings'}
+    results = []
+    stderr = ''
+    for _ in range(rounds):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+        stderr = proc.stderr
+    best = min(results, key=lambda result: result['boot_ms'])
+    best['imports'] = parse_importtime(stderr)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--max-boot-ms', type=float, default=1500)
+    parser.add_argument('--max-rss-mb', type=float, default=120)
+    args = parser.parse_args()
+
+    result = run(args.rounds)
+    print(f"\nWorker boot: {result['boot_ms']:.0f} ms, max RSS {result['rss_mb']:.1f} MB")
+    print("Slowest top-level imports (cumulative):")
+    for name, micros in result['imports']:
+        print(f"  {name:<32} {micros / 1000:8.1f} ms")
+
+    problems = []
+    if result['boot_ms'] > args.max_boot_ms:
+        problems.append(f"boot {result['boot_ms']:.0f} ms > {args.max_boot_ms:.0f} ms")
+    if result['rss_mb'] > args.max_rss_mb:
+        problems.append(f"RSS {result['rss_mb']:.1f} MB > {args.max_rss_mb:.0f} MB")
+    if result['heavy']:
+        problems.append(f"heavy modules imported at boot: {', '.join(result['heavy'])}")
+    if problems:
+        sys.exit('❌ ' + '; '.join(problems))
+    print('✅ Within budget.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""generate_summary on a deterministic corpus of short and long articles.
+
+Needs the NLTK data from `python manage.py bootstrap_nlp`.
+
+    python -m benchmarks.summarizer --articles 50
+"""
+import argparse
+import random
+import time
+
+from benchmarks.common import percentiles, print_table, setup_django
+from benchmarks.fixtures import article_text
+
+SIZES = {'short': 8, 'long': 120}  # sentences per article
+
+
+def run(articles=50, seed=7):
+    from news.engines import missing_nltk_resources
+    from news.utils import generate_summary
+
+    missing = missing_nltk_resources()
+    if missing:
+        return {'skipped': {'missing_nltk_data': len(missing)}}
+
+    rng = random.Random(seed)
+    results = {}
+    for name, sentences in SIZES.items():
+        corpus = [(article_text(rng, sentences), f"Story {i}") for i in range(articles)]
+        generate_summary(*corpus[0])  # load tokenizers and stopwords outside the timing
+        samples = []
+        for text, title in corpus:
+            started = time.perf_counter()
+            generate_summary(text, title)
+            samples.append(time.perf_counter() - started)
+        results[name] = percentiles(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table('generate_summary', run(args.articles))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""ArticleListView and the article API over a large seeded table.
+
+Anonymous and personalized (timeline-backed) HTML list pages and the API
+list and detail endpoints, in steady state: templates compiled, timelines and
+fragment caches warm. benchmarks.list_render covers the cold-cache case.
+
+    python -m benchmarks.views --articles 10000 --rounds 30
+    python -m benchmarks.views --articles 100000 --rounds 10
+"""
+import argparse
+import random
+import time
+
+from benchmarks.common import percentiles, print_table, scratch_db, setup_django, use_database
+from benchmarks.fixtures import article_text
+
+CATEGORIES = 12
+
+
+def seed(count, seed=11, chunk_size=5000):
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+    from datetime import timedelta
+    from news.models import Article, Category, UserPreference
+    from news.text import build_teaser, estimate_reading_time
+
+    rng = random.Random(seed)
+    categories = Category.objects.bulk_create(Category(name=f"Category {i}") for i in range(CATEGORIES))
+    bodies = [article_text(rng, 30) for _ in range(50)]  # reuse texts; row count is what matters
+    now = timezone.now()
+    for start in range(0, count, chunk_size):
+        Article.objects.bulk_create([
+            Article(title=f"Article {i}", content=bodies[i % len(bodies)], teaser=build_teaser(bodies[i % len(bodies)]),
+                    reading_time=estimate_reading_time(bodies[i % len(bodies)]), approved=True,
+                    category=categories[i % CATEGORIES], link=f"https://bench.example/{i}",
+                    source_url=f"https://bench.example/{i}", source='Bench',
+                    published_date=now - timedelta(minutes=i))
+            for i in range(start, min(start + chunk_size, count))
+        ])
+    user = User.objects.create_user(username='reader', password='bench')
+    preference, _ = UserPreference.objects.get_or_create(user=user)
+    preference.preferred_categories.set(categories[:3])
+    return user
+
+
+def run(articles=10000, rounds=30):
+    from django.test import Client
+    from news.models import Article
+
+    use_database(scratch_db('views'))
+    user = seed(articles)
+    detail_id = Article.objects.order_by('-published_date').values_list('id', flat=True)[articles // 2]
+
+    anonymous = Client()
+    personalized = Client()
+    personalized.force_login(user)
+    cases = {
+        'list_anon': (anonymous, '/news/?page=3'),
+        'list_user': (personalized, '/news/?page=3'),
+        'api_list': (anonymous, '/api/articles/?page=20'),
+        'api_detail': (anonymous, f'/api/articles/{detail_id}/'),
+    }
+
+    results = {}
+    for name, (client, url) in cases.items():
+        client.get(url)  # warm templates and the user's timeline
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            response = client.get(url)
+            samples.append(time.perf_counter() - started)
+            assert response.status_code == 200, (url, response.status_code)
+        results[name] = percentiles(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=30)
+    args = parser.parse_args()
+
+    setup_django()
+    print_table(f'Views over {args.articles} articles', run(args.articles, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,8 @@
 ASGI config for bytenews project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+This is the supported deployment (e.g. ``uvicorn bytenews.asgi:application``);
+the article stream is not served under WSGI.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
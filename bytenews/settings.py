@@ -33,7 +33,6 @@ INSTALLED_APPS = [
     'users.apps.UsersConfig',
     'news',
     'rest_framework',
-    'debug_toolbar',
 ]
 
 # ---------------------------------
@@ -41,10 +40,12 @@ INSTALLED_APPS = [
 # ---------------------------------
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'news.profiling.SamplingProfilerMiddleware',
+    'news.middleware.ReplicaPinningMiddleware',
+    'news.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -53,6 +54,13 @@ INTERNAL_IPS = [
     "127.0.0.1",
 ]
 
+# debug_toolbar is a development aid only; production profiling goes
+# through news.profiling.SamplingProfilerMiddleware (see NEWS_PROFILING).
+if DEBUG:
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.insert(MIDDLEWARE.index('django.contrib.auth.middleware.AuthenticationMiddleware'),
+                      'debug_toolbar.middleware.DebugToolbarMiddleware')
+
 
 # ---------------------------------
 # 🌐 Root URL Configuration
@@ -66,7 +74,7 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates', BASE_DIR / 'users'],  # ensure templates are recognized
-        'APP_DIRS': True,
+        'APP_DIRS': DEBUG,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -78,10 +86,26 @@ TEMPLATES = [
     },
 ]
 
+# Outside DEBUG, compile each template once per process and keep it.
+if not DEBUG:
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
+# Lifetime of {% cache %} fragments (article cards, sidebar, pagination).
+# Card keys include the article's updated_at, so edits show up immediately.
+NEWS_FRAGMENT_CACHE_TIMEOUT = 60 * 10
+
 # ---------------------------------
-# 🚀 WSGI
+# 🚀 WSGI / ASGI
 # ---------------------------------
+# Deploy bytenews.asgi (e.g. `uvicorn bytenews.asgi:application`): the async
+# API views and the article stream need it. Under WSGI the stream answers 501.
 WSGI_APPLICATION = 'bytenews.wsgi.application'
+ASGI_APPLICATION = 'bytenews.asgi.application'
 
 # ---------------------------------
 # 🗄️ Database
@@ -90,9 +114,44 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'timeout': 20,  # seconds to wait on a locked database before failing
+            # Take the write lock when a transaction starts instead of failing
+            # with "database is locked" when a reader later tries to upgrade.
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Read replicas. Reads are spread across DATABASE_REPLICAS by
+# news.routers.PrimaryReplicaRouter; writes, transactions and clients that
+# wrote in the last REPLICA_PIN_SECONDS stay on the primary. To try it
+# locally, point BYTENEWS_REPLICA_DB at a copy of db.sqlite3 (tests then
+# mirror the replica onto the test primary).
+DATABASE_ROUTERS = ['news.routers.PrimaryReplicaRouter']
+DATABASE_REPLICAS = []
+REPLICA_PIN_SECONDS = 5
+
+if os.environ.get('BYTENEWS_REPLICA_DB'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ['BYTENEWS_REPLICA_DB'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS = ['replica']
+
+# Applied to each new SQLite connection by news.db. WAL lets readers run
+# alongside the ingestion writer; NORMAL sync is durable across app crashes
+# in WAL mode and only risks the last transactions on power loss.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,      # ms
+    'cache_size': -64000,       # negative = KiB, so 64 MB of page cache
+    'mmap_size': 268435456,     # 256 MB
+    'temp_store': 'MEMORY',
+}
+
 # ---------------------------------
 # 🔐 Password Validators
 # ---------------------------------
@@ -137,13 +196,89 @@ STATIC_ROOT = BASE_DIR / "staticfiles"  # for collectstatic (useful in productio
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'  # where gTTS audio files will be stored
 
+# Generated audio goes through STORAGES['audio'] (news.storage.audio_storage).
+# Set BYTENEWS_AUDIO_BUCKET to keep it in an S3-compatible object store shared
+# by every web node instead of on this host's MEDIA_ROOT.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    'audio': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+}
+if os.environ.get('BYTENEWS_AUDIO_BUCKET'):
+    STORAGES['audio'] = {
+        'BACKEND': 'news.storage.S3Storage',
+        'OPTIONS': {
+            'endpoint_url': os.environ.get('BYTENEWS_AUDIO_ENDPOINT', 'https://s3.amazonaws.com'),
+            'bucket': os.environ['BYTENEWS_AUDIO_BUCKET'],
+            'access_key': os.environ.get('BYTENEWS_AUDIO_ACCESS_KEY', ''),
+            'secret_key': os.environ.get('BYTENEWS_AUDIO_SECRET_KEY', ''),
+            'region': os.environ.get('BYTENEWS_AUDIO_REGION', 'us-east-1'),
+            'public_url': os.environ.get('BYTENEWS_AUDIO_PUBLIC_URL'),  # unset: presigned URLs
+            'cache_dir': BASE_DIR / 'cache' / 'audio',  # local read-through copies
+        },
+    }
+
 # ---------------------------------
 # 🔑 Default Primary Key
 # ---------------------------------
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'news.renderers.FastJSONRenderer',  # orjson when installed, stdlib json otherwise
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 5,  # 👈 You can adjust the page size
+    # Views opt in with throttle_scope; full-table exports are the expensive ones.
+    'DEFAULT_THROTTLE_RATES': {
+        'export': '10/hour',
+    },
+}
+# news.middleware.CompressionMiddleware (gzip, plus brotli when installed)
+NEWS_COMPRESSION = {
+    'MIN_LENGTH': 860,       # bytes; smaller bodies are not worth the CPU
+    'BROTLI_QUALITY': 5,
+    'SKIP_CONTENT_TYPES': ['audio/', 'video/', 'image/', 'text/event-stream',
+                           'application/zip', 'application/gzip'],
+}
+NEWS_BATCH_MAX_IDS = 100               # ids per /api/articles/batch/ request
+NEWS_BULK_MODERATION_MAX_IDS = 1000    # ids per bulk approve/reject
+NEWS_EXPORT_CHUNK_SIZE = 2000          # rows fetched per round trip while exporting
+NEWS_CHANGES_MAX_LIMIT = 1000          # rows per /api/articles/changes/ page
+NEWS_CHANGES_SETTLE_SECONDS = 2        # hold back rows younger than this from delta sync
+NEWS_MODERATION_QUEUE_MAX_LIMIT = 200  # rows per moderation queue page
+
+# Feeds read by `manage.py scrape_news` (source name -> RSS/Atom URL).
+# Benchmarks point this at a local fixture server.
+NEWS_SOURCES = {
+    'BBC News': "https://feeds.bbci.co.uk/news/rss.xml",
+    'CNN': "http://rss.cnn.com/rss/cnn_topstories.rss",
+    'NDTV': "https://feeds.feedburner.com/ndtvnews-top-stories",
+    'Al Jazeera': "https://www.aljazeera.com/xml/rss/all.xml",
+}
+
+# news.fetch.ArticleFetcher: caps for every page the scraper downloads.
+NEWS_FETCH = {
+    'MAX_BYTES': 2 * 1024 * 1024,
+    'CONNECT_TIMEOUT': 5,      # seconds
+    'READ_TIMEOUT': 10,        # seconds per socket read
+    'TOTAL_TIMEOUT': 30,       # seconds per page, catches slow-drip servers
+    'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)',
+    'CACHE_DIR': os.environ.get('BYTENEWS_FETCH_CACHE_DIR'),  # on-disk page cache, off by default
+    'POOL_MAXSIZE': 4,         # keep-alive connections per host
+}
+
+# Cache-Control/Vary per API endpoint (news.conditional). These describe
+# anonymous responses; authenticated ones are sent as private.
+NEWS_API_CACHE_POLICIES = {
+    'article_list': {
+        'public': True, 'max_age': 30, 's_maxage': 120, 'stale_while_revalidate': 60,
+        'vary': ['Accept', 'Accept-Encoding'],
+    },
+    'article_detail': {
+        'public': True, 'max_age': 60, 's_maxage': 600, 'stale_while_revalidate': 300,
+        'vary': ['Accept', 'Accept-Encoding'],
+    },
 }
 
 
@@ -154,3 +289,119 @@ CACHES = {
         'LOCATION': 'unique-snowflake',
     }
 }
+
+
+# ---------------------------------
+# 👍 Summary Feedback
+# ---------------------------------
+# When True, votes are buffered in the cache and applied in bulk by
+# `manage.py flush_summary_feedback` instead of one UPDATE per vote. The
+# buffer must live in Redis or Memcached, which every process shares and
+# which increment atomically; check news.E001 rejects any other backend.
+SUMMARY_FEEDBACK_WRITE_BEHIND = False
+SUMMARY_FEEDBACK_CACHE = 'default'
+
+# ---------------------------------
+# 📖 Reading History
+# ---------------------------------
+# Detail views queue reading events and a background thread writes them in
+# batches. Events beyond READING_HISTORY_MAX_BACKLOG are dropped, not waited on.
+# Set READING_HISTORY_FLUSH_INTERVAL to None to flush only on demand.
+READING_HISTORY_WRITE_BEHIND = True
+READING_HISTORY_MAX_BACKLOG = 10000
+READING_HISTORY_BATCH_SIZE = 500
+READING_HISTORY_FLUSH_INTERVAL = 2.0  # seconds
+
+# Runs reading history writes synchronously under `manage.py test`.
+TEST_RUNNER = 'news.testing.NewsTestRunner'
+
+# Raw reading events older than this are moved by `manage.py compact_history`
+# into gzip archives (partitioned by month) and ReadingHistoryDaily rollups.
+READING_HISTORY_RETENTION_DAYS = 180
+READING_HISTORY_ARCHIVE_DIR = BASE_DIR / 'archive' / 'reading_history'
+
+# ---------------------------------
+# 🧵 Personalized Timelines
+# ---------------------------------
+# Approved articles are pushed into the cached timelines of users who follow
+# their category. Users following more than TIMELINE_FANOUT_MAX_CATEGORIES
+# categories get their timeline rebuilt on read and cached for
+# TIMELINE_READ_TTL instead.
+TIMELINE_MAX_LENGTH = 500
+TIMELINE_FANOUT_MAX_CATEGORIES = 5
+TIMELINE_TTL = 60 * 60 * 24
+TIMELINE_READ_TTL = 60
+
+# ---------------------------------
+# 🔊 Text-to-Speech
+# ---------------------------------
+# Use news.tts.FakeTTSClient (with an optional 'delay') for offline work.
+NEWS_TTS_CLIENT = {
+    'BACKEND': 'news.tts.GTTSClient',
+    'OPTIONS': {'lang': 'en'},
+}
+
+# ---------------------------------
+# 📡 Article Stream (SSE)
+# ---------------------------------
+# Approvals are published on NEWS_PUBSUB and fanned out to every connected
+# client of /api/stream/articles/. LocalPubSub only reaches clients of the
+# same process; use news.streams.RedisPubSub with several workers.
+NEWS_PUBSUB = {
+    'BACKEND': 'news.streams.LocalPubSub',
+    'OPTIONS': {},
+}
+NEWS_STREAM_HISTORY = 1000      # events kept for Last-Event-ID resume
+NEWS_STREAM_HEARTBEAT = 15      # seconds between keepalive comments
+NEWS_STREAM_RETRY_MS = 5000     # client reconnect delay
+NEWS_STREAM_MAX_DURATION = 300  # seconds before a stream is closed; clients resume
+
+# ---------------------------------
+# 🧵 Background tasks
+# ---------------------------------
+# news.tasks runs work on in-process daemon threads; a full backlog drops
+# tasks rather than blocking. EAGER runs every task inline (tests).
+# Approving articles queues news.moderation.prewarm_article for each one,
+# so summaries, teasers and audio exist before the first reader arrives.
+NEWS_TASKS = {
+    'WORKERS': 2,
+    'MAX_BACKLOG': 10000,
+    'EAGER': False,
+}
+NEWS_PREWARM = {
+    'ENABLED': True,
+    'STEPS': ['summary', 'teaser', 'audio'],
+}
+
+# ---------------------------------
+# 📈 Metrics
+# ---------------------------------
+# Commands such as scrape_news record per-stage timings and counters in
+# news.metrics and hand a run report to every exporter below. /metrics serves
+# this process's registry plus the latest JSON report of each job.
+# Add 'news.metrics.TextfileExporter' to also write <job>.prom for
+# node_exporter's textfile collector. Report series are labelled
+# process=<job> and this process's own series process="web".
+NEWS_METRICS = {
+    'REPORT_DIR': BASE_DIR / 'reports',
+    'EXPORTERS': ['news.metrics.JSONReportExporter'],
+    'KEEP_REPORTS': 20,  # timestamped reports kept per job
+}
+
+# ---------------------------------
+# ⏱️ Request Profiling
+# ---------------------------------
+# SamplingProfilerMiddleware records wall time, queries, cache hits and
+# template time for SAMPLE_RATE of requests; staff can read the per-view
+# aggregate at /__profile__/. With CPROFILE on, sampled requests slower than
+# SLOW_REQUEST_SECONDS leave a .prof dump in CPROFILE_DIR (newest MAX_DUMPS kept).
+# When ENABLED, news.profiling wraps the configured cache and template
+# backends in place; CACHES and TEMPLATES keep their stock BACKENDs.
+NEWS_PROFILING = {
+    'ENABLED': True,
+    'SAMPLE_RATE': 0.01,
+    'SLOW_REQUEST_SECONDS': 1.0,
+    'CPROFILE': False,
+    'CPROFILE_DIR': BASE_DIR / 'profiles',
+    'MAX_DUMPS': 50,
+}
@@ -2,11 +2,11 @@ from django.contrib import admin
 from django.urls import path, include
 from django.contrib.auth import views as auth_views
 from users import views as user_views
+from news.views import metrics_view, profiling_report
 
 # 👇 For serving media during development
 from django.conf import settings
 from django.conf.urls.static import static
-import debug_toolbar
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -18,13 +18,22 @@ urlpatterns = [
     path('news/', include(('news.urls', 'news'), namespace='news')),
     path('users/', include(('users.urls', 'users'), namespace='users')),
 
+    # 📈 Prometheus scrape target (staff / INTERNAL_IPS)
+    path('metrics', metrics_view, name='metrics'),
+
     # ✅ API endpoints
     path('api/', include('news.api_urls')),
 
-    # ✅ Debug toolbar (add this)
-    path('__debug__/', include(debug_toolbar.urls)),
+    # ⏱️ Sampled request profiles (staff)
+    path('__profile__/', profiling_report, name='profiling_report'),
 ]
 
+# ✅ Debug toolbar (development only)
+if settings.DEBUG:
+    import debug_toolbar
+
+    urlpatterns += [path('__debug__/', include(debug_toolbar.urls))]
+
 # ✅ Serve media files in development
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,5 +1,10 @@
 from django.contrib import admin
-from .models import Category, Article, UserPreference, ReadingHistory
+from django.db.models import Count, Q
+from .models import Category, Article, Source, UserPreference, ReadingHistory, ReadingHistoryDaily, SummaryFeedback
+from .moderation import set_approval
+from .pagination import EstimatedCountPaginator
+from .search import has_search_index, search_articles
+from .signals import articles_approved, articles_unapproved
 
 
 @admin.register(Category)
@@ -8,6 +13,26 @@ class CategoryAdmin(admin.ModelAdmin):
     search_fields = ['name']
 
 
+@admin.register(Source)
+class SourceAdmin(admin.ModelAdmin):
+    list_display = ['name']
+    search_fields = ['name']
+
+
+class SourceListFilter(admin.SimpleListFilter):
+    """Source choices from the ``Source`` lookup table instead of a DISTINCT over articles."""
+    title = 'source'
+    parameter_name = 'source'
+
+    def lookups(self, request, model_admin):
+        return [(name, name) for name in Source.objects.values_list('name', flat=True)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(source=self.value())
+        return queryset
+
+
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
     list_display = [
@@ -18,8 +43,12 @@ class ArticleAdmin(admin.ModelAdmin):
         'get_approval_status',
         'summary_feedback',
     ]
-    list_filter = ['category', 'published_date', 'source', 'approved']
-    search_fields = ['title', 'content', 'summary']
+    list_filter = ['category', 'published_date', SourceListFilter, 'approved']
+    # Title-only LIKE is the fallback; with the FTS index, get_search_results
+    # also matches content and summary.
+    search_fields = ['title']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     # ✅ Make sure 'approved' is editable (remove it from readonly_fields)
     readonly_fields = ['created_at']  # ✅ Now approved is editable in admin form
@@ -38,27 +67,42 @@ class ArticleAdmin(admin.ModelAdmin):
     summary_feedback.short_description = "Summary Feedback"
 
     def approve_articles(self, request, queryset):
-        updated = queryset.update(approved=True)
-        self.message_user(request, f"{updated} article(s) approved.")
+        updated = set_approval(queryset.values_list('id', flat=True), approved=True)
+        self.message_user(request, f"{len(updated)} article(s) approved.")
     approve_articles.short_description = "✅ Approve selected articles"
 
     def disapprove_articles(self, request, queryset):
-        updated = queryset.update(approved=False)
-        self.message_user(request, f"{updated} article(s) disapproved.")
+        updated = set_approval(queryset.values_list('id', flat=True), approved=False)
+        self.message_user(request, f"{len(updated)} article(s) disapproved.")
     disapprove_articles.short_description = "❌ Disapprove selected articles"
 
+    def get_search_results(self, request, queryset, search_term):
+        if search_term and has_search_index(queryset.db):
+            return search_articles(queryset, search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if 'approved' in form.changed_data or (not change and obj.approved):
+            signal = articles_approved if obj.approved else articles_unapproved
+            signal.send(sender=Article, article_ids=[obj.pk])
+
     def changelist_view(self, request, extra_context=None):
         response = super().changelist_view(request, extra_context=extra_context)
         try:
             qs = response.context_data['cl'].queryset
         except (AttributeError, KeyError):
-            qs = Article.objects.all()
+            return response  # redirect after an action, or an error page
 
         extra_context = extra_context or {}
+        stats = qs.aggregate(
+            approved_count=Count('pk', filter=Q(approved=True)),
+            pending_count=Count('pk', filter=Q(approved=False)),
+        )
         extra_context['article_stats'] = {
-            'approved': qs.filter(approved=True).count(),
-            'pending': qs.filter(approved=False).count(),
-            'total': qs.count(),
+            'approved': stats['approved_count'],
+            'pending': stats['pending_count'],
+            'total': stats['approved_count'] + stats['pending_count'],
         }
         response.context_data.update(extra_context)
         return response
@@ -75,3 +119,16 @@ class ReadingHistoryAdmin(admin.ModelAdmin):
     list_display = ['user', 'article', 'read_at']
     list_filter = ['read_at']
     readonly_fields = ['read_at']
+
+
+@admin.register(ReadingHistoryDaily)
+class ReadingHistoryDailyAdmin(admin.ModelAdmin):
+    list_display = ['user', 'category', 'day', 'count']
+    list_filter = ['day', 'category']
+
+
+@admin.register(SummaryFeedback)
+class SummaryFeedbackAdmin(admin.ModelAdmin):
+    list_display = ['user', 'article', 'helpful', 'created_at']
+    list_filter = ['helpful', 'created_at']
+    readonly_fields = ['created_at']
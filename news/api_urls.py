@@ -2,13 +2,37 @@ from django.urls import path
 from .api_views import (
     ArticleListAPIView,
     ArticleDetailAPIView,
+    ArticleAudioAPIView,
     UserPreferenceAPIView,
     GenerateSummaryAudioAPIView,
+    ArticleBatchAPIView,
+    ArticleChangesAPIView,
+    BulkModerationAPIView,
+    ModerationQueueAPIView,
+    ArticleExportNDJSONAPIView,
+    ArticleExportCSVAPIView,
 )
+from . import async_views
 
 urlpatterns = [
     path('articles/', ArticleListAPIView.as_view(), name='api_article_list'),
     path('articles/<int:pk>/', ArticleDetailAPIView.as_view(), name='api_article_detail'),
+    path('articles/<int:pk>/audio/', ArticleAudioAPIView.as_view(), name='api_article_audio'),
+    path('articles/batch/', ArticleBatchAPIView.as_view(), name='api_article_batch'),
+    path('articles/changes/', ArticleChangesAPIView.as_view(), name='api_article_changes'),
+    path('articles/bulk-moderate/', BulkModerationAPIView.as_view(), name='api_article_bulk_moderate'),
+    path('moderation/queue/', ModerationQueueAPIView.as_view(), name='api_moderation_queue'),
+    path('articles/export.ndjson', ArticleExportNDJSONAPIView.as_view(), name='api_article_export_ndjson'),
+    path('articles/export.csv', ArticleExportCSVAPIView.as_view(), name='api_article_export_csv'),
     path('preferences/', UserPreferenceAPIView.as_view(), name='api_user_preferences'),
     path('articles/<int:pk>/generate-summary-audio/', GenerateSummaryAudioAPIView.as_view(), name='api_generate_audio'),
+
+    # ⚡ Async (ASGI) variants
+    path('async/articles/', async_views.article_list, name='api_async_article_list'),
+    path('async/articles/<int:pk>/', async_views.article_detail, name='api_async_article_detail'),
+    path('async/articles/<int:pk>/generate-summary/', async_views.trigger_summary, name='api_async_generate_summary'),
+    path('async/articles/<int:pk>/generate-audio/', async_views.trigger_audio, name='api_async_generate_audio'),
+
+    # 📡 Server-Sent Events
+    path('stream/articles/', async_views.article_stream, name='api_article_stream'),
 ]
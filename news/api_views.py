@@ -1,23 +1,78 @@
+import csv
+import json
+
 from rest_framework import generics, permissions
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
-from .models import Article, UserPreference
-from .serializers import ArticleSerializer, UserPreferenceSerializer
-from .utils import generate_summary
-from gtts import gTTS
-from django.core.files.base import ContentFile
-import io
+from .changes import changes_since, parse_watermark
+from .conditional import ConditionalGetMixin, make_etag
+from .models import Article, ArticleTombstone, UserPreference
+from .moderation import pending_articles, set_approval
+from .pagination import KnownCountPagination
+from .serializers import ArticleSerializer, ModerationQueueSerializer, UserPreferenceSerializer, audio_link
+from .storage import audio_storage
+from .utils import generate_audio_summary, generate_summary
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max, Subquery
+from django.http import Http404, HttpResponseRedirect, StreamingHttpResponse
+from django.utils.cache import add_never_cache_headers
+
+EXPORT_FIELDS = ['id', 'title', 'summary', 'content', 'author', 'published_date', 'category', 'audio_file']
 
 
-class ArticleListAPIView(generics.ListAPIView):
+class ArticleListAPIView(ConditionalGetMixin, generics.ListAPIView):
     queryset = Article.objects.filter(approved=True).order_by('-published_date')
     serializer_class = ArticleSerializer
+    pagination_class = KnownCountPagination
+    cache_policy = 'article_list'
+
+    def get_validators(self):
+        # Edits and approvals move the newest updated_at of the approved rows;
+        # unapprovals and deletes take a row out of that set and leave a
+        # tombstone instead, so the list changed at the later of the two.
+        latest_tombstone = ArticleTombstone.objects.order_by('-created_at').values('created_at')[:1]
+        watermark = Article.objects.filter(approved=True).aggregate(
+            last_modified=Max('updated_at'), removed=Max(Subquery(latest_tombstone)), total=Count('id'),
+        )
+        last_modified = max(filter(None, (watermark['last_modified'], watermark['removed'])), default=None)
+        self.paginator.known_count = watermark['total']
+        etag = make_etag('articles', last_modified, watermark['total'], self.request.GET.urlencode())
+        return etag, last_modified
 
 
-class ArticleDetailAPIView(generics.RetrieveAPIView):
+class ArticleDetailAPIView(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Article.objects.filter(approved=True)
     serializer_class = ArticleSerializer
+    cache_policy = 'article_detail'
+
+    def get_validators(self):
+        # The row is fetched once here (404s raise as usual) and reused by
+        # retrieve(), so a 304 costs the same single query as a 200.
+        self.object = self.get_object()
+        updated_at = self.object.updated_at
+        return make_etag('article', self.object.pk, updated_at.timestamp()), updated_at
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.get_serializer(self.object).data)
+
+
+class ArticleAudioAPIView(APIView):
+    """``GET /api/articles/<pk>/audio/``: redirects to a fresh storage URL.
+
+    This is the ``audio_file`` link the API hands out, so cached article
+    payloads never carry a presigned URL that has since expired.
+    """
+
+    def get(self, request, pk):
+        name = Article.objects.filter(pk=pk, approved=True).values_list('audio_file', flat=True).first()
+        if not name:
+            raise Http404("No audio for this article.")
+        response = HttpResponseRedirect(audio_storage.url(name))
+        add_never_cache_headers(response)
+        return response
 
 
 class UserPreferenceAPIView(generics.RetrieveUpdateAPIView):
@@ -37,19 +92,170 @@ class GenerateSummaryAudioAPIView(APIView):
 
             if not article.summary:
                 article.summary = generate_summary(article.content, article.title)
-                article.save()
-
-            tts = gTTS(article.summary[:5000], lang='en')
-            audio_bytes = io.BytesIO()
-            tts.write_to_fp(audio_bytes)
-            audio_bytes.seek(0)
-
-            filename = f"{article.pk}_summary_api.mp3"
-            article.audio_file.save(filename, ContentFile(audio_bytes.read()))
-            article.save()
+                article.save(update_fields=['summary'])
 
+            if not generate_audio_summary(article):
+                raise Article.DoesNotExist  # deleted while the audio was generated
             return Response({'message': 'Audio summary generated successfully.', 'audio_url': article.audio_file.url})
         except Article.DoesNotExist:
             return Response({'error': 'Article not found.'}, status=404)
         except Exception as e:
             return Response({'error': str(e)}, status=500)
+
+
+class ArticleChangesAPIView(APIView):
+    """``GET /api/articles/changes/?since=<watermark>``: rows changed since the
+    client's last sync plus ids to drop. Omit ``since`` for a full sync and
+    keep following ``watermark`` while ``has_more`` is true."""
+
+    def get(self, request):
+        since, since_id = None, 0
+        if request.query_params.get('since'):
+            try:
+                since, since_id = parse_watermark(request.query_params['since'])
+            except (ValueError, OverflowError):
+                return Response({'error': 'Invalid watermark.'}, status=400)
+        try:
+            limit = min(int(request.query_params.get('limit', 100)), settings.NEWS_CHANGES_MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'limit must be an integer.'}, status=400)
+
+        changes = changes_since(since, since_id, limit=max(limit, 1))
+        return Response({
+            'changes': ArticleSerializer(changes['articles'], many=True, context={'request': request}).data,
+            'deleted': [
+                {'id': tombstone['article_id'], 'reason': tombstone['reason']}
+                for tombstone in changes['deleted']
+            ],
+            'watermark': changes['watermark'],
+            'has_more': changes['has_more'],
+        })
+
+
+# -----------------------------
+# 📦 BULK ENDPOINTS
+# -----------------------------
+def _parse_ids(values, limit):
+    """Turn a list of ids (ints or strings) into unique ints, keeping order."""
+    try:
+        ids = list(dict.fromkeys(int(value) for value in values if str(value).strip()))
+    except (TypeError, ValueError):
+        return None, Response({'error': 'ids must be a list of integers.'}, status=400)
+    if not ids:
+        return None, Response({'error': 'No ids given.'}, status=400)
+    if len(ids) > limit:
+        return None, Response({'error': f'At most {limit} ids per request.'}, status=400)
+    return ids, None
+
+
+class ArticleBatchAPIView(APIView):
+    """``GET /api/articles/batch/?ids=1,2,3``: many articles in one round trip."""
+
+    def get(self, request):
+        ids, error = _parse_ids(request.query_params.get('ids', '').split(','), settings.NEWS_BATCH_MAX_IDS)
+        if error:
+            return error
+
+        found = Article.objects.filter(approved=True).in_bulk(ids)
+        articles = [found[article_id] for article_id in ids if article_id in found]
+        return Response({
+            'results': ArticleSerializer(articles, many=True, context={'request': request}).data,
+            'missing': [article_id for article_id in ids if article_id not in found],
+        })
+
+
+class ModerationQueueAPIView(APIView):
+    """Staff-only ``GET /api/moderation/queue/?after=<cursor>``: pending
+    articles, oldest first. Follow ``next`` until it is null; approve or
+    reject through ``articles/bulk-moderate/``."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        after, after_id = None, 0
+        if request.query_params.get('after'):
+            try:
+                after, after_id = parse_watermark(request.query_params['after'])
+            except (ValueError, OverflowError):
+                return Response({'error': 'Invalid cursor.'}, status=400)
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), settings.NEWS_MODERATION_QUEUE_MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'limit must be an integer.'}, status=400)
+
+        page = pending_articles(after, after_id, limit=max(limit, 1))
+        return Response({
+            'results': ModerationQueueSerializer(page['articles'], many=True).data,
+            'next': page['next'],
+        })
+
+
+class BulkModerationAPIView(APIView):
+    """Staff-only: ``{"action": "approve" | "reject", "ids": [...]}``."""
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        action = request.data.get('action')
+        if action not in ('approve', 'reject'):
+            return Response({'error': 'action must be "approve" or "reject".'}, status=400)
+        raw_ids = request.data.get('ids')
+        if not isinstance(raw_ids, list):
+            return Response({'error': 'ids must be a list of integers.'}, status=400)
+        ids, error = _parse_ids(raw_ids, settings.NEWS_BULK_MODERATION_MAX_IDS)
+        if error:
+            return error
+
+        updated = set_approval(ids, approved=action == 'approve')
+        return Response({'action': action, 'updated': updated})
+
+
+def _export_rows(request):
+    queryset = (
+        Article.objects.filter(approved=True)
+        .order_by('id')
+        .values_list(*[field if field != 'category' else 'category_id' for field in EXPORT_FIELDS])
+    )
+    for row in queryset.iterator(chunk_size=settings.NEWS_EXPORT_CHUNK_SIZE):
+        row = dict(zip(EXPORT_FIELDS, row))
+        if row['audio_file']:
+            row['audio_file'] = audio_link(row['id'], request)
+        yield row
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to csv.writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+class _ExportAPIView(APIView):
+    """Full-table exports: signed-in users only, throttled per user."""
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'export'
+
+
+class ArticleExportNDJSONAPIView(_ExportAPIView):
+    """Streams every approved article, one JSON object per line."""
+
+    def get(self, request):
+        lines = (json.dumps(row, cls=DjangoJSONEncoder) + '\n' for row in _export_rows(request))
+        response = StreamingHttpResponse(lines, content_type='application/x-ndjson')
+        response['Content-Disposition'] = 'attachment; filename="articles.ndjson"'
+        return response
+
+
+class ArticleExportCSVAPIView(_ExportAPIView):
+    """Streams every approved article as CSV."""
+
+    def get(self, request):
+        writer = csv.writer(_Echo())
+
+        def lines():
+            yield writer.writerow(EXPORT_FIELDS)
+            for row in _export_rows(request):
+                yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+        response = StreamingHttpResponse(lines(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="articles.csv"'
+        return response
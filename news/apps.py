@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class NewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'news'
+
+    def ready(self):
+        import news.db
+        import news.timelines
+        import news.streams
+        import news.changes
+        import news.profiling
+        import news.moderation
+        import news.checks
+        import news.search
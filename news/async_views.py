@@ -0,0 +1,163 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .models import Article
+from .serializers import ArticleSerializer
+from .streams import format_event, get_broadcaster, replay_since
+from .tts import get_tts_client
+from .utils import generate_summary, save_audio_summary
+
+NOT_AUTHENTICATED = {'detail': 'Authentication credentials were not provided.'}
+NOT_FOUND = {'detail': 'No Article matches the given query.'}
+STREAM_NEEDS_ASGI = {'detail': 'The article stream is only served by the ASGI application (bytenews.asgi).'}
+
+
+# -----------------------------
+# 📄 ASYNC ARTICLE LIST / DETAIL (JSON)
+# -----------------------------
+@require_GET
+async def article_list(request):
+    """Same payload as ``ArticleListAPIView`` without holding a worker thread."""
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+    try:
+        page = int(request.GET.get('page', 1))
+    except ValueError:
+        page = 0
+
+    queryset = Article.objects.filter(approved=True).order_by('-published_date')
+    count = await queryset.acount()
+    offset = (page - 1) * page_size
+    if page < 1 or (offset >= count and page != 1):
+        return JsonResponse({'detail': 'Invalid page.'}, status=404)
+
+    articles = [article async for article in queryset[offset:offset + page_size]]
+    url = request.build_absolute_uri()
+    return JsonResponse({
+        'count': count,
+        'next': replace_query_param(url, 'page', page + 1) if offset + page_size < count else None,
+        'previous': None if page == 1 else (
+            remove_query_param(url, 'page') if page == 2 else replace_query_param(url, 'page', page - 1)
+        ),
+        'results': ArticleSerializer(articles, many=True, context={'request': request}).data,
+    })
+
+
+@require_GET
+async def article_detail(request, pk):
+    try:
+        article = await Article.objects.filter(approved=True).aget(pk=pk)
+    except Article.DoesNotExist:
+        return JsonResponse(NOT_FOUND, status=404)
+    return JsonResponse(ArticleSerializer(article, context={'request': request}).data)
+
+
+# -----------------------------
+# 🧠 ASYNC SUMMARY / AUDIO TRIGGERS
+# -----------------------------
+async def _load_for_user(request, pk):
+    user = await request.auser()
+    if not user.is_authenticated:
+        return None, JsonResponse(NOT_AUTHENTICATED, status=403)
+    try:
+        return await Article.objects.aget(pk=pk), None
+    except Article.DoesNotExist:
+        return None, JsonResponse(NOT_FOUND, status=404)
+
+
+async def _ensure_summary(article):
+    if not article.summary:
+        # CPU-bound NLP; run it off the event loop without pinning the sync thread.
+        article.summary = await sync_to_async(generate_summary, thread_sensitive=False)(
+            article.content, article.title
+        )
+        await article.asave(update_fields=['summary'])
+    return article.summary
+
+
+@require_POST
+async def trigger_summary(request, pk):
+    article, error = await _load_for_user(request, pk)
+    if error:
+        return error
+    summary = await _ensure_summary(article)
+    return JsonResponse({'status': 'success', 'summary': summary})
+
+
+@require_POST
+async def trigger_audio(request, pk):
+    article, error = await _load_for_user(request, pk)
+    if error:
+        return error
+
+    summary = await _ensure_summary(article)
+    if not summary:
+        return JsonResponse({'status': 'error', 'message': 'Could not generate summary.'}, status=500)
+
+    try:
+        audio = await get_tts_client().asynthesize(summary)
+    except Exception as e:
+        return JsonResponse({'status': 'error', 'message': f'Failed to generate audio: {e}'}, status=502)
+
+    if not await sync_to_async(save_audio_summary)(article, audio):
+        return JsonResponse(NOT_FOUND, status=404)  # deleted while the audio was generated
+    return JsonResponse({'status': 'success', 'audio_url': article.audio_file.url})
+
+
+# -----------------------------
+# 📡 SERVER-SENT EVENTS: NEWLY APPROVED ARTICLES
+# -----------------------------
+@require_GET
+async def article_stream(request):
+    """Push newly approved articles; ``Last-Event-ID`` resumes after a reconnect.
+
+    Only served under ASGI (``bytenews.asgi``): a WSGI worker would be held
+    for the whole connection, so it answers 501 instead. Streams end after
+    NEWS_STREAM_MAX_DURATION seconds and the browser reconnects, resuming
+    from the last event it saw.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(STREAM_NEEDS_ASGI, status=501)
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    loop = asyncio.get_running_loop()
+    broadcaster = get_broadcaster()
+    queue, backlog, gap = broadcaster.subscribe(loop, last_event_id)
+    if gap:
+        replayed = await sync_to_async(replay_since)(last_event_id)
+        seen = {event['data']['id'] for event in backlog}
+        backlog = [event for event in replayed if event['data']['id'] not in seen] + backlog
+
+    async def events():
+        try:
+            yield f"retry: {settings.NEWS_STREAM_RETRY_MS}\n\n"
+            for event in backlog:
+                yield format_event(event)
+            deadline = loop.time() + settings.NEWS_STREAM_MAX_DURATION
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=min(settings.NEWS_STREAM_HEARTBEAT, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield format_event(event)
+        finally:
+            broadcaster.unsubscribe(loop, queue)
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
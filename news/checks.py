@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.checks import Error, register
+from django.core.exceptions import ImproperlyConfigured
+
+from .feedback import feedback_cache
+
+
+@register()
+def check_summary_feedback_cache(app_configs, **kwargs):
+    """Write-behind votes must be buffered where the flush command can see them."""
+    if not getattr(settings, 'SUMMARY_FEEDBACK_WRITE_BEHIND', False):
+        return []
+    try:
+        feedback_cache()
+    except ImproperlyConfigured as exc:
+        return [Error(
+            str(exc),
+            hint="Point SUMMARY_FEEDBACK_CACHE at a Redis or Memcached cache alias.",
+            id='news.E001',
+        )]
+    return []
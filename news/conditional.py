@@ -0,0 +1,60 @@
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Quoted ETag hashed from ``parts`` (ids, timestamps, counts...)."""
+    digest = hashlib.blake2b('|'.join(str(part) for part in parts).encode(), digest_size=12)
+    return quote_etag(digest.hexdigest())
+
+
+def apply_cache_policy(request, response, name):
+    """Set ``Cache-Control``/``Vary`` from ``NEWS_API_CACHE_POLICIES[name]``.
+
+    Policies describe anonymous traffic a CDN may share; authenticated
+    requests are downgraded to ``private`` with the same ``max_age``.
+    """
+    policy = dict(settings.NEWS_API_CACHE_POLICIES.get(name, {}))
+    vary = policy.pop('vary', ())
+    user = getattr(request, 'user', None)
+    if policy and user is not None and user.is_authenticated:
+        policy = {'private': True, 'max_age': policy.get('max_age', 0)}
+    if policy:
+        patch_cache_control(response, **policy)
+    if vary:
+        patch_vary_headers(response, vary)
+    return response
+
+
+class ConditionalGetMixin:
+    """Answers ``If-None-Match``/``If-Modified-Since`` before serializing.
+
+    Views implement ``get_validators()`` returning ``(etag, last_modified)``
+    (either may be None) or None to skip conditional handling, e.g. when the
+    object does not exist and the normal 404 path should run.
+    """
+    cache_policy = None
+
+    def get_validators(self):
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        response = None
+        if validators is not None:
+            etag, last_modified = validators
+            timestamp = int(last_modified.timestamp()) if last_modified else None
+            response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if validators is not None and response.status_code in (200, 304):
+            if etag:
+                response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified.timestamp())
+        if self.cache_policy:
+            apply_cache_policy(request, response, self.cache_policy)
+        return response
@@ -0,0 +1,24 @@
+import re
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+
+
+# ---------------------------
+# 🗄️ SQLite connection tuning
+# ---------------------------
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Apply ``settings.SQLITE_PRAGMAS`` to every new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+
+    pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            if not _PRAGMA_NAME.match(name) or not re.match(r'^-?\w+$', str(value)):
+                raise ValueError(f"Invalid SQLite pragma: {name}={value!r}")
+            cursor.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,122 @@
+from functools import cached_property
+
+# nltk/newspaper/feedparser are imported inside the methods below so web
+# workers and manage.py only pay for them when a summary or scrape runs.
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'stopwords': 'corpora/stopwords',
+}
+
+
+def missing_nltk_resources():
+    import nltk
+
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+
+# ---------------------------
+# 🧠 NLP engine
+# ---------------------------
+class NLPEngine:
+    """Tokenizers and stopwords, loaded on first use.
+
+    Missing NLTK data raises ``LookupError`` instead of downloading
+    mid-request; ``manage.py bootstrap_nlp`` installs it.
+    """
+
+    def __init__(self, language='english'):
+        self.language = language
+        self._checked = False
+
+    def _require_data(self):
+        if self._checked:
+            return
+        missing = missing_nltk_resources()
+        if missing:
+            raise LookupError(
+                f"NLTK data not installed: {', '.join(missing)}. Run `python manage.py bootstrap_nlp`."
+            )
+        self._checked = True
+
+    @cached_property
+    def stop_words(self):
+        self._require_data()
+        from nltk.corpus import stopwords
+
+        return frozenset(stopwords.words(self.language))
+
+    def sent_tokenize(self, text):
+        self._require_data()
+        from nltk.tokenize import sent_tokenize
+
+        return sent_tokenize(text, language=self.language)
+
+    def word_tokenize(self, text):
+        self._require_data()
+        from nltk.tokenize import word_tokenize
+
+        return word_tokenize(text, language=self.language)
+
+
+# ---------------------------
+# 📰 Scraping engine
+# ---------------------------
+class ScraperEngine:
+    """Feed parsing and full-text extraction behind one lazily built object.
+
+    All downloads go through ``news.fetch.get_fetcher()``, so newspaper only
+    ever parses a size-capped body and never opens its own connection.
+    """
+
+    @cached_property
+    def config(self):
+        from newspaper import Config
+
+        config = Config()
+        config.fetch_images = False
+        return config
+
+    def parse_feed(self, feed_url):
+        import feedparser
+        from .fetch import FEED_TYPES, get_fetcher
+
+        page = get_fetcher().fetch(feed_url, accept=FEED_TYPES, use_cache=False)
+        return feedparser.parse(page.body)
+
+    def fetch_page(self, url):
+        from .fetch import get_fetcher
+
+        return get_fetcher().fetch(url)
+
+    def extract_from_html(self, url, html):
+        from newspaper import Article as NewsArticle
+
+        news = NewsArticle(url, config=self.config)
+        news.download(input_html=html)
+        news.parse()
+        return news.text.strip()
+
+
+_nlp = None
+_scraper = None
+
+
+def get_nlp_engine():
+    global _nlp
+    if _nlp is None:
+        _nlp = NLPEngine()
+    return _nlp
+
+
+def get_scraper():
+    global _scraper
+    if _scraper is None:
+        _scraper = ScraperEngine()
+    return _scraper
@@ -0,0 +1,171 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import IntegrityError, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+
+from .models import Article, SummaryFeedback
+
+FEEDBACK_FIELDS = {True: 'summary_helpful', False: 'summary_not_helpful'}
+FLUSH_CHUNK_SIZE = 500
+
+# Pending articles are kept as an append-only log built from atomic cache
+# operations only (add/incr/delete), so workers sharing the cache never
+# overwrite each other: the first vote for an article since the last flush
+# wins its ``marker`` and appends the id at the next ``seq`` slot.
+SEQ_KEY = 'summary_feedback:seq'
+FLUSHED_KEY = 'summary_feedback:flushed'
+GAP_KEY = 'summary_feedback:gap'
+FLUSH_LOCK_KEY = 'summary_feedback:flush_lock'
+FLUSH_LOCK_TIMEOUT = 300
+# A voter that dies between winning a marker and writing its slot leaves the
+# marker with no slot to clear it; the timeout bounds how long later votes
+# for that article wait before a new marker queues them again.
+MARKER_TIMEOUT = 3600
+# Only these backends share one store across processes *and* make add/incr
+# atomic there; the file and database caches read-modify-write.
+ATOMIC_CACHES = (RedisCache, BaseMemcachedCache)
+
+
+def _counter_key(article_id, field):
+    return f"summary_feedback:{article_id}:{field}"
+
+
+def _marker_key(article_id):
+    return f"summary_feedback:marker:{article_id}"
+
+
+def _slot_key(seq):
+    return f"summary_feedback:pending:{seq}"
+
+
+def feedback_cache():
+    """The cache votes are buffered in; it must be shared by every process.
+
+    Raises ImproperlyConfigured unless it is Redis or Memcached: per-process
+    caches hide the web workers' votes from the flush command, and the file
+    and database caches lose concurrent increments.
+    """
+    alias = getattr(settings, 'SUMMARY_FEEDBACK_CACHE', 'default')
+    client = caches[alias]
+    if not isinstance(client, ATOMIC_CACHES):
+        raise ImproperlyConfigured(
+            f"SUMMARY_FEEDBACK_WRITE_BEHIND needs a shared cache with atomic increments; "
+            f"CACHES[{alias!r}] is {type(client).__name__}."
+        )
+    return client
+
+
+# ---------------------------
+# 👍 Record a vote
+# ---------------------------
+def record_summary_feedback(user, article_id, helpful):
+    """Record one vote per user and bump the matching counter.
+
+    Returns ``False`` when the user has already voted on this article.
+    """
+    write_behind = getattr(settings, 'SUMMARY_FEEDBACK_WRITE_BEHIND', False)
+    client = feedback_cache() if write_behind else None
+    try:
+        with transaction.atomic():
+            SummaryFeedback.objects.create(user=user, article_id=article_id, helpful=helpful)
+    except IntegrityError:
+        return False
+
+    field = FEEDBACK_FIELDS[bool(helpful)]
+    if write_behind:
+        _buffer_vote(client, article_id, field)
+    else:
+        Article.objects.filter(pk=article_id).update(**{field: F(field) + 1})
+    return True
+
+
+def _buffer_vote(client, article_id, field, count=1):
+    key = _counter_key(article_id, field)
+    if not client.add(key, count, timeout=None):
+        client.incr(key, count)
+    # Counter first, marker second: a flush that deletes the marker in
+    # between still reads this vote's increment.
+    if client.add(_marker_key(article_id), 1, timeout=MARKER_TIMEOUT):
+        client.add(SEQ_KEY, 0, timeout=None)
+        client.set(_slot_key(client.incr(SEQ_KEY)), article_id, timeout=None)
+
+
+# ---------------------------
+# 🚿 Flush buffered votes
+# ---------------------------
+def flush_summary_feedback(client=None):
+    """Apply buffered votes as aggregated ``F()`` deltas.
+
+    Each chunk of articles is written with a single UPDATE. Only one flush
+    runs at a time (a cache lock); a second caller returns 0. A slot whose
+    seq was taken but not yet written stops the flush there; if it is still
+    missing on the next run (the voter died, or it was evicted) it is
+    skipped, and its article is queued again by the next vote after its
+    marker expires. Returns the number of votes flushed.
+    """
+    client = client or feedback_cache()
+    if not client.add(FLUSH_LOCK_KEY, 1, timeout=FLUSH_LOCK_TIMEOUT):
+        return 0
+    try:
+        flushed = 0
+        start = (client.get(FLUSHED_KEY) or 0) + 1
+        end = client.get(SEQ_KEY) or 0
+        gap = client.get(GAP_KEY)
+        for chunk_start in range(start, end + 1, FLUSH_CHUNK_SIZE):
+            seqs = range(chunk_start, min(chunk_start + FLUSH_CHUNK_SIZE, end + 1))
+            slots = client.get_many([_slot_key(seq) for seq in seqs])
+            missing = next((seq for seq in seqs if _slot_key(seq) not in slots and seq != gap), None)
+            if missing is not None:
+                seqs = range(chunk_start, missing)
+                slots = {key: value for key, value in slots.items() if int(key.rsplit(':', 1)[1]) < missing}
+                client.set(GAP_KEY, missing, timeout=None)
+            article_ids = sorted(set(slots.values()))
+            client.delete_many([_marker_key(article_id) for article_id in article_ids])
+            flushed += _flush_chunk(client, article_ids)
+            client.delete_many(list(slots))
+            if seqs:
+                client.set(FLUSHED_KEY, seqs[-1], timeout=None)
+            if missing is not None:
+                break
+        return flushed
+    finally:
+        client.delete(FLUSH_LOCK_KEY)
+
+
+def _flush_chunk(client, article_ids):
+    keys = {
+        (article_id, field): _counter_key(article_id, field)
+        for article_id in article_ids
+        for field in FEEDBACK_FIELDS.values()
+    }
+    counts = client.get_many(keys.values())
+
+    deltas = {}
+    for (article_id, field), key in keys.items():
+        count = counts.get(key) or 0
+        if count:
+            client.decr(key, count)
+            deltas[(article_id, field)] = count
+    if not deltas:
+        return 0
+
+    updates = {}
+    for field in FEEDBACK_FIELDS.values():
+        whens = [
+            When(pk=article_id, then=Value(count))
+            for (article_id, delta_field), count in deltas.items()
+            if delta_field == field
+        ]
+        if whens:
+            updates[field] = F(field) + Case(*whens, default=Value(0), output_field=IntegerField())
+
+    try:
+        Article.objects.filter(pk__in={article_id for article_id, _ in deltas}).update(**updates)
+    except Exception:
+        for (article_id, field), count in deltas.items():
+            _buffer_vote(client, article_id, field, count)
+        raise
+    return sum(deltas.values())
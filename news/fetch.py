@@ -0,0 +1,180 @@
+import hashlib
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+HTML_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+FEED_TYPES = frozenset({
+    'application/rss+xml', 'application/atom+xml', 'application/rdf+xml',
+    'application/xml', 'text/xml', 'text/plain',
+})
+
+_meta_charset = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+class FetchError(Exception):
+    """The page could not be fetched (network error, HTTP error, too slow)."""
+
+
+class FetchSkipped(FetchError):
+    """The page was refused on purpose: wrong content type or over the size cap."""
+
+
+class FetchedPage:
+    def __init__(self, url, content_type, body, encoding=None, from_cache=False):
+        self.url = url
+        self.content_type = content_type
+        self.body = body
+        self.encoding = encoding
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        encoding = self.encoding
+        if not encoding:
+            match = _meta_charset.search(self.body[:2048])
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        try:
+            return self.body.decode(encoding, errors='replace')
+        except LookupError:  # unknown charset name
+            return self.body.decode('utf-8', errors='replace')
+
+
+# ---------------------------
+# 🌐 Bounded article fetcher
+# ---------------------------
+class ArticleFetcher:
+    """Streams pages with hard caps so one huge or slow-drip page cannot stall a scrape.
+
+    One keep-alive ``requests.Session`` is kept per host. Bodies are read in
+    chunks and abandoned past ``max_bytes`` or ``total_timeout`` seconds;
+    ``read_timeout`` bounds each socket read. Unwanted content types are
+    refused from the headers alone. With ``cache_dir`` set, bodies are kept
+    on disk by URL so extraction can be re-run without the network.
+    """
+
+    chunk_size = 16 * 1024
+
+    def __init__(self, max_bytes=2 * 1024 * 1024, connect_timeout=5, read_timeout=10, total_timeout=30,
+                 user_agent='bytenews/1.0', cache_dir=None, pool_maxsize=4):
+        self.max_bytes = max_bytes
+        self.timeout = (connect_timeout, read_timeout)
+        self.total_timeout = total_timeout
+        self.user_agent = user_agent
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.pool_maxsize = pool_maxsize
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url):
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.headers['User-Agent'] = self.user_agent
+                session.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize))
+                self._sessions[host] = session
+        return session
+
+    def fetch(self, url, accept=HTML_TYPES, use_cache=True):
+        cached = self._read_cache(url) if use_cache else None
+        if cached is not None:
+            return cached
+
+        import requests
+
+        try:
+            with self.session_for(url).get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if content_type and content_type not in accept:
+                    raise FetchSkipped(f"{url}: content type {content_type!r}")
+                length = response.headers.get('Content-Length', '')
+                if length.isdigit() and int(length) > self.max_bytes:
+                    raise FetchSkipped(f"{url}: {length} bytes exceeds {self.max_bytes}")
+                body = self._read_body(url, response)
+                encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '') else None
+        except requests.RequestException as e:
+            raise FetchError(f"{url}: {e}") from e
+
+        page = FetchedPage(url, content_type, body, encoding)
+        if use_cache:
+            self._write_cache(page)
+        return page
+
+    def _read_body(self, url, response):
+        deadline = time.monotonic() + self.total_timeout
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise FetchSkipped(f"{url}: body exceeds {self.max_bytes} bytes")
+            if time.monotonic() > deadline:
+                raise FetchError(f"{url}: download took longer than {self.total_timeout}s")
+        return bytes(body)
+
+    def _cache_path(self, url):
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+
+    def _read_cache(self, url):
+        if self.cache_dir is None:
+            return None
+        path = self._cache_path(url)
+        if not path.exists():
+            return None
+        header, _, body = path.read_bytes().partition(b'\n')
+        content_type, _, encoding = header.decode('ascii').partition(';')
+        return FetchedPage(url, content_type, body, encoding or None, from_cache=True)
+
+    def _write_cache(self, page):
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(page.url)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(f"{page.content_type};{page.encoding or ''}\n".encode('ascii') + page.body)
+        tmp.replace(path)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_fetcher = None
+
+
+def get_fetcher():
+    global _fetcher
+    if _fetcher is None:
+        config = settings.NEWS_FETCH
+        _fetcher = ArticleFetcher(
+            max_bytes=config['MAX_BYTES'],
+            connect_timeout=config['CONNECT_TIMEOUT'],
+            read_timeout=config['READ_TIMEOUT'],
+            total_timeout=config['TOTAL_TIMEOUT'],
+            user_agent=config['USER_AGENT'],
+            cache_dir=config.get('CACHE_DIR'),
+            pool_maxsize=config.get('POOL_MAXSIZE', 4),
+        )
+    return _fetcher
+
+
+@receiver(setting_changed)
+def reset_fetcher(setting, **kwargs):
+    global _fetcher
+    if setting == 'NEWS_FETCH' and _fetcher is not None:
+        _fetcher.close()
+        _fetcher = None
@@ -0,0 +1,189 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .metrics import HISTORY_BACKLOG, HISTORY_FLUSH_SECONDS, HISTORY_LOST
+from .models import ReadingHistory
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------
+# 📖 Write-behind recorder
+# ---------------------------
+class ReadingHistoryRecorder:
+    """Buffers reading events in memory and writes them in batches.
+
+    The buffer is bounded: once ``max_backlog`` events are waiting, new events
+    are dropped and counted rather than blocking the request. A failed batch
+    is requeued and the flush stops until the next interval; events still
+    failing after ``max_attempts`` writes (or with no room left to requeue)
+    are dropped and counted. Backlog, flush time and losses are also exported
+    through ``news.metrics.REGISTRY``.
+    """
+
+    def __init__(self, max_backlog=10000, batch_size=500, flush_interval=2.0, max_attempts=3):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._queue = queue.Queue(maxsize=max_backlog)
+        self._stats_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        self.recorded = 0
+        self.dropped = 0
+        self.failed = 0
+        self.retried = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+
+    def record(self, user_id, article_id, read_at=None):
+        try:
+            self._queue.put_nowait((user_id, article_id, read_at or timezone.now(), 1))
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            HISTORY_LOST.inc(reason='backlog_full')
+            return False
+
+        with self._stats_lock:
+            self.recorded += 1
+        HISTORY_BACKLOG.set(self._queue.qsize())
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        self._ensure_flusher()
+        return True
+
+    def flush(self):
+        """Write everything currently buffered. Returns the number of rows sent."""
+        total = 0
+        with self._flush_lock:
+            while True:
+                batch = self._drain()
+                if not batch:
+                    break
+                started = time.perf_counter()
+                try:
+                    ReadingHistory.objects.bulk_create(
+                        [
+                            ReadingHistory(user_id=user_id, article_id=article_id, read_at=read_at)
+                            for user_id, article_id, read_at, _ in batch
+                        ],
+                        ignore_conflicts=True,
+                    )
+                except Exception:
+                    logger.exception("Failed to write %d reading history events", len(batch))
+                    self._requeue(batch)
+                    break
+
+                elapsed = time.perf_counter() - started
+                HISTORY_FLUSH_SECONDS.observe(elapsed)
+                with self._stats_lock:
+                    self.flushed += len(batch)
+                    self.flushes += 1
+                    self.last_flush_seconds = elapsed
+                    self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+                total += len(batch)
+        HISTORY_BACKLOG.set(self._queue.qsize())
+        return total
+
+    def stats(self):
+        with self._stats_lock:
+            return {
+                'backlog': self._queue.qsize(),
+                'recorded': self.recorded,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'retried': self.retried,
+                'flushed': self.flushed,
+                'flushes': self.flushes,
+                'last_flush_seconds': self.last_flush_seconds,
+                'max_flush_seconds': self.max_flush_seconds,
+            }
+
+    def _requeue(self, batch):
+        retried = lost = 0
+        for user_id, article_id, read_at, attempts in batch:
+            if attempts < self.max_attempts:
+                try:
+                    self._queue.put_nowait((user_id, article_id, read_at, attempts + 1))
+                    retried += 1
+                    continue
+                except queue.Full:
+                    pass
+            lost += 1
+        if lost:
+            logger.error("Dropping %d reading history events after failed flushes", lost)
+            HISTORY_LOST.inc(lost, reason='flush_failed')
+        with self._stats_lock:
+            self.retried += retried
+            self.failed += lost
+
+    def _drain(self):
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _ensure_flusher(self):
+        if self._thread is not None or not self.flush_interval:
+            return
+        with self._stats_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='reading-history-flusher', daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder():
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = ReadingHistoryRecorder(
+                    max_backlog=getattr(settings, 'READING_HISTORY_MAX_BACKLOG', 10000),
+                    batch_size=getattr(settings, 'READING_HISTORY_BATCH_SIZE', 500),
+                    flush_interval=getattr(settings, 'READING_HISTORY_FLUSH_INTERVAL', 2.0),
+                )
+    return _recorder
+
+
+def record_reading(user, article):
+    """Record that ``user`` opened ``article`` without blocking on the write
+    when write-behind is enabled."""
+    if getattr(settings, 'READING_HISTORY_WRITE_BEHIND', True):
+        return get_recorder().record(user.pk, article.pk)
+
+    ReadingHistory.objects.bulk_create(
+        [ReadingHistory(user=user, article=article)], ignore_conflicts=True
+    )
+    return True
@@ -0,0 +1,187 @@
+import math
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Article, Category, ReadingHistory, UserPreference
+from .text import WORDS_PER_MINUTE, build_teaser
+
+LINK_PREFIX = 'https://load.bytenews.example/'
+USERNAME_PREFIX = 'loadgen_'
+CATEGORY_PREFIX = 'Loadgen '
+
+SOURCES = ('Wire', 'Metro Daily', 'Tech Ledger', 'Sports Desk', 'Health Weekly', 'Global Times', 'Market Watch')
+VOCABULARY = (
+    "the a of to in and for on with by from at as about after over under between against during "
+    "council market energy policy climate research team league court health city school water report "
+    "data growth price vote plan minister study players season company workers trial storm election "
+    "budget hospital police river airport startup investors museum festival village farmers drought "
+    "reform inflation rates tariffs vaccine doctors nurses students teachers coach striker "
+    "announced said warned expects rose fell signed approved rejected launched reported confirmed "
+    "new local national regional early late major minor record quarterly annual public private "
+    "officials residents analysts experts leaders critics supporters families visitors engineers"
+).split()
+
+# Article bodies: word counts are log-normal (median ~550 words, long tail),
+# clamped to what the scraper would plausibly store.
+BODY_MEDIAN_WORDS = 550
+BODY_SIGMA = 0.7
+BODY_MIN_WORDS, BODY_MAX_WORDS = 60, 6000
+PARAGRAPH_POOL = 500
+APPROVED_RATIO = 0.95
+PREFERRED_READ_RATIO = 0.7
+
+
+def _sentence(rng):
+    text = ' '.join(rng.choices(VOCABULARY, k=rng.randint(8, 28)))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _paragraph_pool(rng, size=PARAGRAPH_POOL):
+    """``(text, word_count)`` paragraphs that article bodies are assembled from."""
+    pool = []
+    for _ in range(size):
+        text = ' '.join(_sentence(rng) for _ in range(rng.randint(2, 7)))
+        pool.append((text, len(text.split())))
+    return pool
+
+
+def _body(rng, pool):
+    target = min(BODY_MAX_WORDS, max(BODY_MIN_WORDS, int(rng.lognormvariate(math.log(BODY_MEDIAN_WORDS), BODY_SIGMA))))
+    paragraphs, words = [], 0
+    while words < target:
+        text, count = rng.choice(pool)
+        paragraphs.append(text)
+        words += count
+    return '\n\n'.join(paragraphs), words
+
+
+def _title(rng):
+    return ' '.join(rng.choices(VOCABULARY, k=rng.randint(5, 12))).title()[:200]
+
+
+def _chunks(total, chunk_size):
+    for start in range(0, total, chunk_size):
+        yield start, min(start + chunk_size, total)
+
+
+# ---------------------------
+# 🏭 Synthetic load data
+# ---------------------------
+def generate_load_data(categories=20, articles=10000, users=1000, history_per_user=50, seed=42,
+                       chunk_size=5000, days=365, password='loadtest', progress=None):
+    """Insert a deterministic synthetic dataset for load and performance testing.
+
+    Categories get Zipf-like popularity, which skews both where articles land
+    and which categories users prefer. Bodies are assembled from a pool of
+    generated paragraphs so text lengths follow a realistic distribution
+    without generating every word. Rows are written with ``bulk_create`` in
+    ``chunk_size`` transactions, so no save() or signal runs: ``teaser`` and
+    ``reading_time`` are filled in here, and timelines are built on first
+    read. Each table draws from its own seeded stream, so changing one count
+    leaves the others' data unchanged. Returns the number of rows per model.
+    """
+    progress = progress or (lambda message: None)
+    now = timezone.now()
+    span = timedelta(days=days).total_seconds()
+    counts = {}
+
+    category_objs = Category.objects.bulk_create(
+        Category(name=f"{CATEGORY_PREFIX}{i}", description=f"Synthetic category {i}") for i in range(categories)
+    )
+    weights = [1 / (rank + 1) for rank in range(categories)]
+    counts['categories'] = len(category_objs)
+
+    rng = random.Random(f"{seed}-articles")
+    pool = _paragraph_pool(rng)
+    ids_by_category = {category.pk: [] for category in category_objs}
+    for start, end in _chunks(articles, chunk_size):
+        batch = []
+        for i in range(start, end):
+            content, words = _body(rng, pool)
+            category = rng.choices(category_objs, weights)[0]
+            batch.append(Article(
+                title=_title(rng), content=content, teaser=build_teaser(content),
+                reading_time=max(1, math.ceil(words / WORDS_PER_MINUTE)),
+                link=f"{LINK_PREFIX}{seed}/{i}", source_url=f"{LINK_PREFIX}{seed}/{i}",
+                source=rng.choice(SOURCES), category=category,
+                published_date=now - timedelta(seconds=rng.random() * span),
+                approved=rng.random() < APPROVED_RATIO,
+            ))
+        with transaction.atomic():
+            Article.objects.bulk_create(batch)
+        for article in batch:
+            if article.approved:
+                ids_by_category[article.category_id].append(article.pk)
+        progress(f"articles {end}/{articles}")
+    counts['articles'] = articles
+
+    rng = random.Random(f"{seed}-users")
+    password_hash = make_password(password)  # hashed once; every load user shares it
+    preferences_by_user = {}
+    for start, end in _chunks(users, chunk_size):
+        with transaction.atomic():
+            user_objs = User.objects.bulk_create(
+                User(username=f"{USERNAME_PREFIX}{seed}_{i}", password=password_hash) for i in range(start, end)
+            )
+            prefs = UserPreference.objects.bulk_create(UserPreference(user=user) for user in user_objs)
+            links = []
+            for user, pref in zip(user_objs, prefs):
+                chosen = {category.pk for category in rng.choices(category_objs, weights, k=rng.randint(1, 4))}
+                preferences_by_user[user.pk] = sorted(chosen)
+                links.extend(
+                    UserPreference.preferred_categories.through(userpreference_id=pref.pk, category_id=category_id)
+                    for category_id in chosen
+                )
+            UserPreference.preferred_categories.through.objects.bulk_create(links)
+        progress(f"users {end}/{users}")
+    counts['users'] = users
+
+    rng = random.Random(f"{seed}-history")
+    all_ids = [pk for ids in ids_by_category.values() for pk in ids]
+    batch, history = [], 0
+    if not all_ids:
+        preferences_by_user = {}  # nothing approved to read
+    for user_id, preferred in preferences_by_user.items():
+        preferred_ids = [ids_by_category[pk] for pk in preferred if ids_by_category[pk]]
+        seen = set()
+        for _ in range(rng.randint(0, 2 * history_per_user)):
+            if preferred_ids and rng.random() < PREFERRED_READ_RATIO:
+                article_id = rng.choice(rng.choice(preferred_ids))
+            else:
+                article_id = rng.choice(all_ids)
+            if article_id in seen:
+                continue
+            seen.add(article_id)
+            batch.append(ReadingHistory(
+                user_id=user_id, article_id=article_id, read_at=now - timedelta(seconds=rng.random() * span),
+            ))
+        if len(batch) >= chunk_size:
+            with transaction.atomic():
+                ReadingHistory.objects.bulk_create(batch)
+            history += len(batch)
+            batch = []
+            progress(f"reading history {history}")
+    if batch:
+        with transaction.atomic():
+            ReadingHistory.objects.bulk_create(batch)
+        history += len(batch)
+    counts['reading_history'] = history
+    return counts
+
+
+def clear_load_data():
+    """Delete everything ``generate_load_data`` created; returns rows deleted per model."""
+    with transaction.atomic():
+        _, users = User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+        _, articles = Article.objects.filter(link__startswith=LINK_PREFIX).delete()
+        _, categories = Category.objects.filter(name__startswith=CATEGORY_PREFIX).delete()
+    deleted = {}
+    for counter in (users, articles, categories):
+        for label, count in counter.items():
+            deleted[label] = deleted.get(label, 0) + count
+    return deleted
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from news.routers import use_primary
+from news.models import Article
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Fills the stored teaser and reading time for articles saved before they existed.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--all', action='store_true', help='Recompute every article, not just empty teasers.')
+
+    @use_primary()
+    def handle(self, *args, **options):
+        queryset = Article.objects.only('id', 'content', 'summary').order_by('id')
+        if not options['all']:
+            queryset = queryset.filter(teaser='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id)[:options['chunk_size']])
+            if not chunk:
+                break
+            now = timezone.now()
+            for article in chunk:
+                article.refresh_teaser()
+                article.updated_at = now
+            Article.objects.bulk_update(chunk, ['teaser', 'reading_time', 'updated_at'])
+            updated += len(chunk)
+            last_id = chunk[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Backfilled teasers for {updated} article(s)."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from news.engines import NLTK_RESOURCES, missing_nltk_resources
+
+
+class Command(BaseCommand):
+    help = 'Downloads the NLTK data the summarizer needs (run once per deploy, not per worker).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report; exit non-zero if anything is missing.')
+        parser.add_argument('--download-dir', help='Install into this directory instead of the NLTK default.')
+        parser.add_argument('--force', action='store_true', help='Download every resource even if present.')
+
+    def handle(self, *args, **options):
+        missing = list(NLTK_RESOURCES) if options['force'] else missing_nltk_resources()
+        if not missing:
+            self.stdout.write(self.style.SUCCESS("✅ NLTK data already installed."))
+            return
+        if options['check']:
+            raise CommandError(f"Missing NLTK data: {', '.join(missing)}")
+
+        import nltk
+
+        failed = [
+            name for name in missing
+            if not nltk.download(name, download_dir=options['download_dir'], quiet=True)
+        ]
+        if failed:
+            raise CommandError(f"Could not download: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS(f"✅ Installed NLTK data: {', '.join(missing)}"))
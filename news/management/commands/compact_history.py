@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from news.routers import use_primary
+from news.models import ReadingHistory
+from news.retention import compact_history, history_cutoff
+
+
+class Command(BaseCommand):
+    help = 'Archives reading history older than the retention window and folds it into daily rollups.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Raw events to keep, in days (default: READING_HISTORY_RETENTION_DAYS).')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--archive-dir', default=None,
+                            help='Where compressed archives go (default: READING_HISTORY_ARCHIVE_DIR).')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would move.')
+
+    @use_primary()
+    def handle(self, *args, **options):
+        cutoff = history_cutoff(options['days'])
+        archive_dir = options['archive_dir'] or settings.READING_HISTORY_ARCHIVE_DIR
+
+        if options['dry_run']:
+            pending = ReadingHistory.objects.filter(read_at__lt=cutoff).count()
+            self.stdout.write(f"🔍 {pending} reading history row(s) older than {cutoff:%Y-%m-%d} would be compacted.")
+            return
+
+        self.stdout.write(f"🗜️ Compacting reading history older than {cutoff:%Y-%m-%d} into {archive_dir}...")
+        totals = compact_history(cutoff, archive_dir, chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Archived {totals['rows']} row(s) in {totals['chunks']} chunk(s) "
+            f"across {len(totals['files'])} file(s)."
+        ))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from news.routers import use_primary
+from news.feedback import flush_summary_feedback
+
+
+class Command(BaseCommand):
+    help = 'Applies summary feedback votes buffered in the cache to the article counters.'
+
+    @use_primary()
+    def handle(self, *args, **kwargs):
+        flushed = flush_summary_feedback()
+        self.stdout.write(self.style.SUCCESS(f"✅ Flushed {flushed} buffered vote(s)."))
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from news.loadgen import clear_load_data, generate_load_data
+from news.routers import use_primary
+
+
+class Command(BaseCommand):
+    help = 'Generates a deterministic synthetic dataset (categories, articles, users, reading history) for load testing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--articles', type=int, default=10000)
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--history-per-user', type=int, default=50,
+                            help='Average reading history rows per user.')
+        parser.add_argument('--days', type=int, default=365,
+                            help='Publish and read dates are spread over this many days.')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--password', default='loadtest', help='Password shared by every generated user.')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete previously generated load data first.')
+
+    @use_primary()
+    def handle(self, *args, **options):
+        if options['categories'] < 1:
+            raise CommandError('--categories must be at least 1.')
+        if options['clear']:
+            deleted = clear_load_data()
+            self.stdout.write(f"🧹 Removed {sum(deleted.values())} row(s) of earlier load data.")
+
+        verbose = options['verbosity'] > 1
+        started = time.perf_counter()
+        counts = generate_load_data(
+            categories=options['categories'],
+            articles=options['articles'],
+            users=options['users'],
+            history_per_user=options['history_per_user'],
+            seed=options['seed'],
+            chunk_size=options['chunk_size'],
+            days=options['days'],
+            password=options['password'],
+            progress=(lambda message: self.stdout.write(f"  … {message}")) if verbose else None,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Generated {counts['categories']} categories, {counts['articles']} articles, "
+            f"{counts['users']} users and {counts['reading_history']} reading history rows "
+            f"in {time.perf_counter() - started:.1f}s."
+        ))
@@ -0,0 +1,304 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+# ---------------------------
+# 📈 Metric types
+# ---------------------------
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self):
+        with self._lock:
+            samples = [
+                {'labels': dict(zip(self.label_names, key)), **self._sample(value)}
+                for key, value in sorted(self._values.items())
+            ]
+        return {'type': self.kind, 'help': self.documentation, 'samples': samples}
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _sample(self, value):
+        return {'value': value}
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][i] += 1
+            state['sum'] += value
+            state['count'] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _sample(self, state):
+        return {
+            'buckets': [[bound, count] for bound, count in zip(self.buckets, state['counts'])],
+            'sum': state['sum'],
+            'count': state['count'],
+        }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        self._metrics.setdefault(metric.name, metric)
+        return self._metrics[metric.name]
+
+    def counter(self, name, documentation, labels=()):
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name, documentation, labels=()):
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def reset(self):
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def snapshot(self):
+        return {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+
+
+REGISTRY = MetricsRegistry()
+
+# Ingestion (scrape_news / fetch_news_from_rss)
+SCRAPE_STAGE_SECONDS = REGISTRY.histogram(
+    'bytenews_scrape_stage_seconds', 'Time spent in each ingestion stage.', labels=('source', 'stage'),
+)
+SCRAPE_SOURCE_SECONDS = REGISTRY.histogram(
+    'bytenews_scrape_source_seconds', 'Wall time to ingest one source.', labels=('source',),
+)
+SCRAPE_ARTICLES = REGISTRY.counter(
+    'bytenews_scrape_articles_total',
+    'Feed entries by outcome, one per entry: skipped (already stored), fetched (full text), '
+    'fallback (feed summary used), failed (no usable content).',
+    labels=('source', 'outcome'),
+)
+SCRAPE_INSERTS = REGISTRY.counter(
+    'bytenews_scrape_inserts_total', 'Scraped articles saved by outcome: inserted, duplicate, failed.',
+    labels=('source', 'outcome'),
+)
+SCRAPE_FEED_ERRORS = REGISTRY.counter(
+    'bytenews_scrape_feed_errors_total', 'Feeds that could not be fetched or parsed.', labels=('source',),
+)
+SCRAPE_LAST_RUN = REGISTRY.gauge(
+    'bytenews_scrape_last_run_timestamp_seconds', 'Unix time the last scrape finished.',
+)
+# Cleared at the start of every scrape so its run report covers that run only.
+SCRAPE_METRICS = (
+    SCRAPE_STAGE_SECONDS, SCRAPE_SOURCE_SECONDS, SCRAPE_ARTICLES, SCRAPE_INSERTS, SCRAPE_FEED_ERRORS,
+    SCRAPE_LAST_RUN,
+)
+
+# Reading history write-behind (news.history)
+HISTORY_BACKLOG = REGISTRY.gauge(
+    'bytenews_reading_history_backlog', 'Reading events queued in this process, not yet written.',
+)
+HISTORY_FLUSH_SECONDS = REGISTRY.histogram(
+    'bytenews_reading_history_flush_seconds', 'Time to write one batch of reading events.',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+HISTORY_LOST = REGISTRY.counter(
+    'bytenews_reading_history_lost_total',
+    'Reading events never written: backlog_full (dropped on record), flush_failed (out of retries).',
+    labels=('reason',),
+)
+
+
+# ---------------------------
+# 📤 Exporters
+# ---------------------------
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render_prometheus(snapshot):
+    """Prometheus text exposition format (0.0.4) for a registry snapshot."""
+    lines = []
+    for name, family in snapshot.items():
+        if not family['samples']:
+            continue
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['type']}")
+        for sample in family['samples']:
+            labels = sample['labels']
+            if family['type'] != 'histogram':
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(sample['value'])}")
+                continue
+            for bound, count in sample['buckets']:
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+            lines.append(f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {sample['count']}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+def label_snapshot(snapshot, **labels):
+    """``snapshot`` with ``labels`` added to every sample."""
+    return {
+        name: {**family, 'samples': [{**sample, 'labels': {**sample['labels'], **labels}}
+                                     for sample in family['samples']]}
+        for name, family in snapshot.items()
+    }
+
+
+def merge_snapshots(*snapshots):
+    merged = {}
+    for snapshot in snapshots:
+        for name, family in snapshot.items():
+            target = merged.setdefault(name, {**family, 'samples': []})
+            target['samples'] = target['samples'] + family['samples']
+    return merged
+
+
+def report_dir():
+    return Path(settings.NEWS_METRICS['REPORT_DIR'])
+
+
+class JSONReportExporter:
+    """Writes ``<job>-<timestamp>.json`` plus ``<job>-latest.json`` to REPORT_DIR.
+
+    Only the newest ``KEEP_REPORTS`` timestamped reports of each job are kept.
+    """
+
+    def export(self, report):
+        directory = report_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        body = json.dumps(report, indent=2)
+        stamp = report['finished_at'].replace(':', '').replace('-', '')
+        (directory / f"{report['job']}-{stamp}.json").write_text(body)
+        latest = directory / f"{report['job']}-latest.json"
+        tmp = latest.with_suffix('.tmp')
+        tmp.write_text(body)
+        tmp.replace(latest)
+        self.prune(directory, report['job'])
+        return latest
+
+    def prune(self, directory, job):
+        keep = settings.NEWS_METRICS.get('KEEP_REPORTS', 20)
+        # ISO timestamps sort chronologically; ``<job>-latest.json`` is excluded.
+        stamped = sorted(path for path in directory.glob(f"{job}-[0-9]*.json"))
+        for path in stamped[:max(len(stamped) - keep, 0)]:
+            path.unlink(missing_ok=True)
+
+
+class TextfileExporter:
+    """Writes ``<job>.prom`` for node_exporter's textfile collector."""
+
+    def export(self, report):
+        directory = report_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{report['job']}.prom"
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(render_prometheus(report['metrics']))
+        tmp.replace(path)
+        return path
+
+
+def build_report(job, started, registry=REGISTRY):
+    finished = time.time()
+    return {
+        'job': job,
+        'started_at': datetime.fromtimestamp(started, tz=dt_timezone.utc).isoformat(timespec='seconds'),
+        'finished_at': datetime.fromtimestamp(finished, tz=dt_timezone.utc).isoformat(timespec='seconds'),
+        'duration_seconds': round(finished - started, 3),
+        'metrics': registry.snapshot(),
+    }
+
+
+def export_report(report):
+    """Run every exporter in ``NEWS_METRICS['EXPORTERS']``; returns the paths written."""
+    return [import_string(path)().export(report) for path in settings.NEWS_METRICS['EXPORTERS']]
+
+
+def latest_reports():
+    """Metrics snapshots from the newest run report of every job.
+
+    Every sample is labelled ``process=<job>``, so a job's series never
+    collide with the same series from another job or the serving process.
+    """
+    directory = report_dir()
+    if not directory.is_dir():
+        return []
+    snapshots = []
+    for path in sorted(directory.glob('*-latest.json')):
+        try:
+            report = json.loads(path.read_text())
+            snapshots.append(label_snapshot(report['metrics'], process=report['job']))
+        except (OSError, ValueError, KeyError):
+            continue
+    return snapshots
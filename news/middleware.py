@@ -0,0 +1,139 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+from .routers import _pinned
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+
+# ---------------------------
+# 📌 Replica pinning
+# ---------------------------
+class ReplicaPinningMiddleware:
+    """Route a client's reads to the primary for a few seconds after it writes.
+
+    The pin is a short-lived cookie, so it holds across worker processes.
+    Unsafe methods always pin; views that write on GET call
+    ``news.routers.pin_primary(request)``.
+    """
+
+    cookie_name = 'db_pin'
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _pinned.set(self._should_pin(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._set_pin(request, response)
+
+    async def __acall__(self, request):
+        token = _pinned.set(self._should_pin(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        return self._set_pin(request, response)
+
+    def _should_pin(self, request):
+        return self.cookie_name in request.COOKIES or request.method not in SAFE_METHODS
+
+    def _set_pin(self, request, response):
+        if request.method not in SAFE_METHODS or getattr(request, '_pin_primary', False):
+            response.set_cookie(
+                self.cookie_name, '1',
+                max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 5),
+                httponly=True, samesite='Lax',
+            )
+        return response
+
+
+# ---------------------------
+# 🗜️ Response compression
+# ---------------------------
+re_accepts_brotli = _lazy_re_compile(r'\bbr\b')
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """``GZipMiddleware`` with brotli, a size threshold and content-type skips.
+
+    Brotli is used when the ``brotli`` package is installed and the client
+    sends ``br``. HTML always takes the gzip path, which carries Django's
+    random-length padding against BREACH. Streaming responses are compressed
+    chunk by chunk; already-compressed media and event streams are left alone.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        options = settings.NEWS_COMPRESSION
+        self.min_length = options.get('MIN_LENGTH', 200)
+        self.brotli_quality = options.get('BROTLI_QUALITY', 5)
+        self.skip_types = tuple(options.get('SKIP_CONTENT_TYPES', ()))
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+        content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type.startswith(self.skip_types):
+            return response
+        if (
+            brotli is not None
+            and content_type != 'text/html'
+            and re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return self._brotli_response(response)
+        return super().process_response(request, response)
+
+    def _brotli_response(self, response):
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if response.streaming:
+            original_iterator = response.streaming_content
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+
+            def compress(chunk):
+                return compressor.process(chunk) + compressor.flush()
+
+            if response.is_async:
+                async def brotli_wrapper():
+                    async for chunk in original_iterator:
+                        yield compress(chunk)
+                    yield compressor.finish()
+            else:
+                def brotli_wrapper():
+                    for chunk in original_iterator:
+                        yield compress(chunk)
+                    yield compressor.finish()
+
+            response.streaming_content = brotli_wrapper()
+            del response.headers['Content-Length']
+        else:
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0008_alter_article_options_alter_readinghistory_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SummaryFeedback',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('helpful', models.BooleanField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='summary_feedback', to='news.article')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='summary_feedback', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Summary Feedback',
+                'verbose_name_plural': 'Summary Feedback',
+                'constraints': [models.UniqueConstraint(fields=('user', 'article'), name='unique_summary_feedback_per_user')],
+            },
+        ),
+    ]
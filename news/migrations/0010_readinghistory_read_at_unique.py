@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:31
+
+from django.conf import settings
+from django.db import migrations, models
+import django.utils.timezone
+from django.db.models import Count, Max
+
+
+def remove_duplicate_history(apps, schema_editor):
+    ReadingHistory = apps.get_model('news', 'ReadingHistory')
+    duplicates = (
+        ReadingHistory.objects.values('user_id', 'article_id')
+        .annotate(keep_id=Max('id'), entries=Count('id'))
+        .filter(entries__gt=1)
+        .order_by()
+    )
+    for row in list(duplicates):
+        ReadingHistory.objects.filter(
+            user_id=row['user_id'], article_id=row['article_id']
+        ).exclude(id=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0009_summaryfeedback'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_history, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='readinghistory',
+            name='read_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddConstraint(
+            model_name='readinghistory',
+            constraint=models.UniqueConstraint(fields=('user', 'article'), name='unique_reading_history_entry'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0010_readinghistory_read_at_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadingHistoryDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Daily Reading Rollup',
+                'verbose_name_plural': 'Daily Reading Rollups',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='readinghistory',
+            index=models.Index(fields=['user', '-read_at'], name='history_user_read_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readinghistory',
+            index=models.Index(fields=['read_at'], name='history_read_at_idx'),
+        ),
+        migrations.AddField(
+            model_name='readinghistorydaily',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reading_rollups', to='news.category'),
+        ),
+        migrations.AddField(
+            model_name='readinghistorydaily',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reading_rollups', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='readinghistorydaily',
+            index=models.Index(fields=['day'], name='rollup_day_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='readinghistorydaily',
+            constraint=models.UniqueConstraint(fields=('user', 'category', 'day'), name='unique_reading_rollup'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0011_reading_history_retention'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, help_text='Estimated minutes to read.'),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='teaser',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
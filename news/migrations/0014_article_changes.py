@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 17:44
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0013_article_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('article_id', models.BigIntegerField(db_index=True)),
+                ('reason', models.CharField(choices=[('deleted', 'Deleted'), ('unapproved', 'Unapproved')], max_length=20)),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
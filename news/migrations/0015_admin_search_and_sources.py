@@ -0,0 +1,98 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:08
+
+from django.db import migrations, models
+
+# External-content FTS5 index over the searchable article text, kept in step
+# by triggers. The update trigger only fires when indexed columns change.
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE news_article_fts USING fts5(
+        title, content, summary,
+        content='news_article', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER news_article_fts_ai AFTER INSERT ON news_article BEGIN
+        INSERT INTO news_article_fts(rowid, title, content, summary)
+        VALUES (new.id, new.title, new.content, new.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER news_article_fts_ad AFTER DELETE ON news_article BEGIN
+        INSERT INTO news_article_fts(news_article_fts, rowid, title, content, summary)
+        VALUES ('delete', old.id, old.title, old.content, old.summary);
+    END
+    """,
+    """
+    CREATE TRIGGER news_article_fts_au AFTER UPDATE OF title, content, summary ON news_article BEGIN
+        INSERT INTO news_article_fts(news_article_fts, rowid, title, content, summary)
+        VALUES ('delete', old.id, old.title, old.content, old.summary);
+        INSERT INTO news_article_fts(rowid, title, content, summary)
+        VALUES (new.id, new.title, new.content, new.summary);
+    END
+    """,
+    "INSERT INTO news_article_fts(news_article_fts) VALUES ('rebuild')",
+    """
+    CREATE TRIGGER news_article_source_ai AFTER INSERT ON news_article BEGIN
+        INSERT OR IGNORE INTO news_source(name) VALUES (new.source);
+    END
+    """,
+    """
+    CREATE TRIGGER news_article_source_au AFTER UPDATE OF source ON news_article BEGIN
+        INSERT OR IGNORE INTO news_source(name) VALUES (new.source);
+    END
+    """,
+]
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS news_article_source_au",
+    "DROP TRIGGER IF EXISTS news_article_source_ai",
+    "DROP TRIGGER IF EXISTS news_article_fts_au",
+    "DROP TRIGGER IF EXISTS news_article_fts_ad",
+    "DROP TRIGGER IF EXISTS news_article_fts_ai",
+    "DROP TABLE IF EXISTS news_article_fts",
+]
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in CREATE_SQL:
+            schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in DROP_SQL:
+            schema_editor.execute(statement)
+
+
+def fill_sources(apps, schema_editor):
+    Article = apps.get_model('news', 'Article')
+    Source = apps.get_model('news', 'Source')
+    names = Article.objects.values_list('source', flat=True).distinct().order_by()
+    Source.objects.bulk_create([Source(name=name) for name in names], ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0014_article_changes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Source',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['source'], name='article_source_idx'),
+        ),
+        migrations.RunPython(fill_sources, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0015_admin_search_and_sources'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('approved', False)), fields=['created_at', 'id'], name='article_pending_queue_idx'),
+        ),
+    ]
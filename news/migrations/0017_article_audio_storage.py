@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:14
+
+import news.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0016_article_pending_queue_idx'),
+    ]
+
+    # State only: the column is unchanged, and on SQLite a real AlterField
+    # rebuilds news_article, dropping the triggers from 0015.
+    operations = [
+        migrations.SeparateDatabaseAndState(state_operations=[
+            migrations.AlterField(
+                model_name='article',
+                name='audio_file',
+                field=models.FileField(blank=True, null=True, storage=news.storage.get_audio_storage, upload_to='audio/'),
+            ),
+        ]),
+    ]
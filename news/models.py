@@ -2,6 +2,9 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+from .storage import get_audio_storage
+from .text import build_teaser, estimate_reading_time
+
 # ---------------------------
 # 📂 Category Model
 # ---------------------------
@@ -23,6 +26,8 @@ class Article(models.Model):
     title = models.CharField(max_length=200)
     content = models.TextField()
     summary = models.TextField(blank=True, null=True)
+    teaser = models.TextField(blank=True, default='')
+    reading_time = models.PositiveSmallIntegerField(default=1, help_text="Estimated minutes to read.")
 
     link = models.URLField(max_length=500, unique=True, null=True, blank=True)
     source = models.CharField(max_length=100, default='Unknown')
@@ -33,8 +38,9 @@ class Article(models.Model):
 
     published_date = models.DateTimeField(default=timezone.now)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
-    audio_file = models.FileField(upload_to='audio/', blank=True, null=True)
+    audio_file = models.FileField(upload_to='audio/', storage=get_audio_storage, blank=True, null=True)
 
     summary_helpful = models.PositiveIntegerField(default=0)
     summary_not_helpful = models.PositiveIntegerField(default=0)
@@ -46,6 +52,22 @@ class Article(models.Model):
     approved_status.boolean = True
     approved_status.short_description = "Approval Status"
 
+    def refresh_teaser(self):
+        self.teaser = build_teaser(self.summary or self.content)
+        self.reading_time = estimate_reading_time(self.content)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            # auto_now is only written when listed, and updated_at versions caches.
+            update_fields = kwargs['update_fields'] = {*update_fields, 'updated_at'}
+        text_changed = update_fields is None or {'content', 'summary'} & update_fields
+        if text_changed and not {'content', 'summary'} & self.get_deferred_fields():
+            self.refresh_teaser()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'teaser', 'reading_time'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title
 
@@ -53,6 +75,30 @@ class Article(models.Model):
         ordering = ['-published_date']
         verbose_name = "Article"
         verbose_name_plural = "Articles"
+        indexes = [
+            models.Index(fields=['source'], name='article_source_idx'),
+            # Keyset pages of the moderation queue only ever touch pending rows.
+            models.Index(fields=['created_at', 'id'], condition=models.Q(approved=False),
+                         name='article_pending_queue_idx'),
+        ]
+
+
+# ---------------------------
+# 🏷️ Source Model
+# ---------------------------
+class Source(models.Model):
+    """Distinct ``Article.source`` values, for admin filters.
+
+    On SQLite, triggers (migration 0015) insert a row whenever an article
+    with a new source is written, so nothing has to scan articles for them.
+    """
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ['name']
 
 
 # ---------------------------
@@ -72,7 +118,7 @@ class UserPreference(models.Model):
 class ReadingHistory(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     article = models.ForeignKey(Article, on_delete=models.CASCADE)
-    read_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(default=timezone.now)
 
     def __str__(self):
         return f"{self.user.username} read {self.article.title}"
@@ -81,3 +127,75 @@ class ReadingHistory(models.Model):
         ordering = ['-read_at']
         verbose_name = "Reading History"
         verbose_name_plural = "Reading Histories"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'article'], name='unique_reading_history_entry'),
+        ]
+        indexes = [
+            models.Index(fields=['user', '-read_at'], name='history_user_read_at_idx'),
+            models.Index(fields=['read_at'], name='history_read_at_idx'),
+        ]
+
+
+# ---------------------------
+# 👍 Summary Feedback Model
+# ---------------------------
+class SummaryFeedback(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='summary_feedback')
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='summary_feedback')
+    helpful = models.BooleanField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        vote = "helpful" if self.helpful else "not helpful"
+        return f"{self.user.username} found {self.article.title} {vote}"
+
+    class Meta:
+        verbose_name = "Summary Feedback"
+        verbose_name_plural = "Summary Feedback"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'article'], name='unique_summary_feedback_per_user'),
+        ]
+
+
+# ---------------------------
+# 📊 Daily Reading Rollup Model
+# ---------------------------
+class ReadingHistoryDaily(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reading_rollups')
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='reading_rollups')
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.user.username} read {self.count} in {self.category.name} on {self.day}"
+
+    class Meta:
+        ordering = ['-day']
+        verbose_name = "Daily Reading Rollup"
+        verbose_name_plural = "Daily Reading Rollups"
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'category', 'day'], name='unique_reading_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['day'], name='rollup_day_idx'),
+        ]
+
+
+# ---------------------------
+# 🪦 Article Tombstone Model
+# ---------------------------
+class ArticleTombstone(models.Model):
+    """Marks an article that left the public API, so delta-sync clients can drop it."""
+    DELETED = 'deleted'
+    UNAPPROVED = 'unapproved'
+    REASON_CHOICES = [(DELETED, 'Deleted'), (UNAPPROVED, 'Unapproved')]
+
+    article_id = models.BigIntegerField(db_index=True)
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"Article {self.article_id} {self.reason}"
+
+    class Meta:
+        ordering = ['created_at']
@@ -0,0 +1,94 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .changes import format_watermark
+from .models import Article
+from .routers import use_primary
+from .signals import articles_approved, articles_unapproved
+from .tasks import enqueue
+from .utils import generate_audio_summary, generate_summary
+
+
+# ---------------------------
+# ✅ Approval changes
+# ---------------------------
+def set_approval(article_ids, approved):
+    """Approve or unapprove articles with one UPDATE and notify listeners.
+
+    Only rows whose state actually changes are updated and signalled.
+    Returns their ids.
+    """
+    changed = list(
+        Article.objects.filter(pk__in=list(article_ids))
+        .exclude(approved=approved)
+        .values_list('id', flat=True)
+    )
+    if changed:
+        Article.objects.filter(pk__in=changed).update(approved=approved, updated_at=timezone.now())
+        signal = articles_approved if approved else articles_unapproved
+        signal.send(sender=Article, article_ids=changed)
+    return changed
+
+
+# ---------------------------
+# 📥 Moderation queue
+# ---------------------------
+def pending_articles(after=None, after_id=0, limit=50):
+    """Oldest-first page of unapproved articles after the ``(created_at, id)`` cursor.
+
+    Keyset pages stay as cheap on the last page as on the first, and rows
+    approved between requests cannot shift later pages the way OFFSET would.
+    ``next`` is None on the last page.
+    """
+    queryset = Article.objects.filter(approved=False).select_related('category').defer('content', 'summary')
+    if after is not None:
+        queryset = queryset.filter(Q(created_at__gt=after) | Q(created_at=after, id__gt=after_id))
+    rows = list(queryset.order_by('created_at', 'id')[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        'articles': rows,
+        'next': format_watermark(rows[-1].created_at, rows[-1].id) if has_more else None,
+    }
+
+
+# ---------------------------
+# 🔥 Pre-warm approved articles
+# ---------------------------
+@use_primary()
+def prewarm_article(article_id):
+    """Generate what a first reader would otherwise wait for.
+
+    Runs the steps in ``NEWS_PREWARM['STEPS']``: the summary (saving it also
+    refreshes teaser and reading time), the teaser alone when the summary
+    already exists, and the audio summary. Finished steps are skipped, so
+    repeating the task is cheap. Articles unapproved meanwhile are left alone.
+    """
+    article = Article.objects.filter(pk=article_id, approved=True).first()
+    if article is None:
+        return
+    steps = settings.NEWS_PREWARM['STEPS']
+    if 'summary' in steps and not article.summary:
+        article.summary = generate_summary(article.content, article.title)
+        article.save(update_fields=['summary'])
+    elif 'teaser' in steps and not article.teaser:
+        article.refresh_teaser()
+        article.save(update_fields=['teaser', 'reading_time'])
+    if 'audio' in steps and article.summary and not article.audio_file:
+        generate_audio_summary(article, only_if_approved=True)
+
+
+@receiver(articles_approved)
+def prewarm_approved_articles(sender, article_ids, **kwargs):
+    if not settings.NEWS_PREWARM['ENABLED']:
+        return
+
+    def schedule():
+        for article_id in article_ids:
+            enqueue(prewarm_article, article_id)
+
+    # Workers read the row on their own connection, so wait for the approval to commit.
+    transaction.on_commit(schedule)
@@ -0,0 +1,60 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class KnownCountPagination(PageNumberPagination):
+    """Page-number pagination that can skip its ``COUNT(*)``.
+
+    Views that already know the row count (e.g. from the aggregate behind
+    their ETag) assign it to ``known_count`` before paginating.
+    """
+    known_count = None
+
+    def django_paginator_class(self, queryset, page_size):
+        paginator = Paginator(queryset, page_size)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+
+def estimated_row_count(model, using='default'):
+    """Cheap row count estimate for ``model``'s table, or None when unavailable.
+
+    SQLite reads ``MAX(rowid)`` off the primary key b-tree, which over-counts
+    by the number of deleted rows; PostgreSQL uses the planner's statistics.
+    """
+    connection = connections[using]
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"SELECT MAX(rowid) FROM {table}")
+        elif connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [model._meta.db_table])
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that skips ``COUNT(*)`` on big unfiltered querysets.
+
+    Filtered querysets (and tables estimated at or below ``exact_below``
+    rows) are still counted exactly; otherwise the page count comes from
+    ``estimated_row_count`` and may be slightly off at the tail.
+    """
+    exact_below = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where and not query.distinct and not query.combinator:
+            estimate = estimated_row_count(queryset.model, using=queryset.db)
+            if estimate is not None and estimate > self.exact_below:
+                return estimate
+        return Paginator.count.func(self)
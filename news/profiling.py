@@ -0,0 +1,267 @@
+import cProfile
+import functools
+import random
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.template.backends.django import Template as BackendTemplate
+from django.utils.module_loading import import_string
+
+# The profile of the sampled request running in this context, or None. The
+# hooks below cost one ContextVar lookup on unsampled requests.
+_current = ContextVar('news_request_profile', default=None)
+_MISSING = object()
+
+
+class RequestProfile:
+    __slots__ = ('queries', 'query_time', 'cache_hits', 'cache_misses', 'template_time', '_template_depth')
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_time = 0.0
+        self._template_depth = 0
+
+
+# ---------------------------
+# 🪝 Hooks (DB, cache, templates)
+# ---------------------------
+def _profile_query(execute, sql, params, many, context):
+    profile = _current.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.queries += 1
+        profile.query_time += time.perf_counter() - started
+
+
+@receiver(connection_created)
+def install_query_hook(sender, connection, **kwargs):
+    if _profile_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_profile_query)
+
+
+def _record_cache(hits, misses):
+    profile = _current.get()
+    if profile is not None:
+        profile.cache_hits += hits
+        profile.cache_misses += misses
+
+
+def _counting_get(get):
+    def wrapper(self, key, default=None, version=None):
+        value = get(self, key, _MISSING, version)
+        _record_cache(value is not _MISSING, value is _MISSING)
+        return default if value is _MISSING else value
+    return wrapper
+
+
+def _counting_get_many(get_many):
+    def wrapper(self, keys, version=None):
+        keys = list(keys)
+        found = get_many(self, keys, version)
+        _record_cache(len(found), len(keys) - len(found))
+        return found
+    return wrapper
+
+
+def _timed_render(render):
+    def wrapper(self, context=None, request=None):
+        profile = _current.get()
+        if profile is None:
+            return render(self, context, request)
+        profile._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            profile._template_depth -= 1
+            if not profile._template_depth:  # render_to_string inside a template is already counted
+                profile.template_time += time.perf_counter() - started
+    return wrapper
+
+
+def _wrap(cls, name, make_wrapper):
+    original = getattr(cls, name)
+    if getattr(original, '_news_profiled', False):
+        return
+    wrapper = functools.wraps(original)(make_wrapper(original))
+    wrapper._news_profiled = True
+    setattr(cls, name, wrapper)
+
+
+def install_hooks():
+    """Wrap the configured cache backends and Django template rendering.
+
+    The configured backends are left as they are; their classes gain the
+    counting wrappers, once, the first time profiling is enabled. Outside a
+    sampled request the wrappers cost one ContextVar lookup.
+    """
+    for options in settings.CACHES.values():
+        backend = import_string(options['BACKEND'])
+        _wrap(backend, 'get', _counting_get)
+        _wrap(backend, 'get_many', _counting_get_many)
+    _wrap(BackendTemplate, 'render', _timed_render)
+
+
+@receiver(setting_changed)
+def install_hooks_on_enable(setting, **kwargs):
+    if setting in ('NEWS_PROFILING', 'CACHES') and settings.NEWS_PROFILING['ENABLED']:
+        install_hooks()
+
+
+# ---------------------------
+# 📊 In-memory aggregation
+# ---------------------------
+class ProfileAggregator:
+    """Per-view totals and maxima of every sampled request."""
+
+    fields = ('wall', 'queries', 'query_time', 'cache_hits', 'cache_misses', 'template_time')
+
+    def __init__(self):
+        self._views = {}
+        self._dumps = []
+        self._lock = threading.Lock()
+
+    def add(self, view, wall, profile, dump=None):
+        sample = {
+            'wall': wall, 'queries': profile.queries, 'query_time': profile.query_time,
+            'cache_hits': profile.cache_hits, 'cache_misses': profile.cache_misses,
+            'template_time': profile.template_time,
+        }
+        with self._lock:
+            stats = self._views.get(view)
+            if stats is None:
+                stats = self._views[view] = {'count': 0, 'total': dict.fromkeys(self.fields, 0), 'max_wall': 0.0}
+            stats['count'] += 1
+            for field in self.fields:
+                stats['total'][field] += sample[field]
+            stats['max_wall'] = max(stats['max_wall'], wall)
+            if dump:
+                self._dumps.append({'view': view, 'wall': wall, 'path': str(dump)})
+                # Older dumps' files are deleted by the middleware; forget them too.
+                del self._dumps[:-settings.NEWS_PROFILING['MAX_DUMPS']]
+
+    def report(self):
+        with self._lock:
+            views = []
+            for view, stats in self._views.items():
+                count, total = stats['count'], stats['total']
+                views.append({
+                    'view': view,
+                    'samples': count,
+                    'mean_ms': total['wall'] / count * 1000,
+                    'max_ms': stats['max_wall'] * 1000,
+                    'mean_queries': total['queries'] / count,
+                    'mean_query_ms': total['query_time'] / count * 1000,
+                    'mean_template_ms': total['template_time'] / count * 1000,
+                    'cache_hit_ratio': (
+                        total['cache_hits'] / (total['cache_hits'] + total['cache_misses'])
+                        if total['cache_hits'] + total['cache_misses'] else None
+                    ),
+                })
+            dumps = list(self._dumps)
+        views.sort(key=lambda row: row['mean_ms'] * row['samples'], reverse=True)
+        return {'views': views, 'dumps': dumps}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+            self._dumps.clear()
+
+
+aggregator = ProfileAggregator()
+
+
+# ---------------------------
+# ⏱️ Sampling middleware
+# ---------------------------
+class SamplingProfilerMiddleware:
+    """Profiles ``NEWS_PROFILING['SAMPLE_RATE']`` of requests.
+
+    Sampled requests record wall time, query count and time, cache hits and
+    template render time into ``aggregator``. With ``CPROFILE`` on, sampled
+    sync requests also run under cProfile, and the dump is kept when they
+    take longer than ``SLOW_REQUEST_SECONDS``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _sampled(self):
+        options = settings.NEWS_PROFILING
+        return options['ENABLED'] and random.random() < options['SAMPLE_RATE']
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        profile = RequestProfile()
+        profiler = cProfile.Profile() if settings.NEWS_PROFILING['CPROFILE'] else None
+        token = _current.set(profile)
+        started = time.perf_counter()
+        try:
+            if profiler is None:
+                response = self.get_response(request)
+            else:
+                response = profiler.runcall(self.get_response, request)
+        finally:
+            wall = time.perf_counter() - started
+            _current.reset(token)
+        self._record(request, wall, profile, profiler)
+        return response
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+        profile = RequestProfile()
+        token = _current.set(profile)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            wall = time.perf_counter() - started
+            _current.reset(token)
+        self._record(request, wall, profile, None)
+        return response
+
+    def _record(self, request, wall, profile, profiler):
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unresolved'
+        dump = None
+        if profiler is not None and wall >= settings.NEWS_PROFILING['SLOW_REQUEST_SECONDS']:
+            dump = self._dump(profiler, view)
+        aggregator.add(view, wall, profile, dump)
+
+    def _dump(self, profiler, view):
+        directory = Path(settings.NEWS_PROFILING['CPROFILE_DIR'])
+        directory.mkdir(parents=True, exist_ok=True)
+        existing = sorted(directory.glob('*.prof'))
+        for old in existing[:max(0, len(existing) - settings.NEWS_PROFILING['MAX_DUMPS'] + 1)]:
+            old.unlink(missing_ok=True)
+        path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{view.replace(':', '_')}-{time.monotonic_ns()}.prof"
+        profiler.dump_stats(path)
+        return path
+
+
+if settings.NEWS_PROFILING['ENABLED']:
+    install_hooks()
@@ -0,0 +1,30 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Drop-in ``JSONRenderer`` that encodes with orjson when it is installed.
+
+    Output matches DRF's compact form (except NaN/Infinity, which orjson
+    writes as null): datetimes, decimals, UUIDs and lazy strings still go
+    through DRF's encoder. Indented output
+    (the browsable API), ``ensure_ascii`` and anything orjson rejects fall
+    back to the stdlib path.
+    """
+    option = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.option)
+        except TypeError:  # includes orjson.JSONEncodeError
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same strict-javascript-subset escaping as JSONRenderer.
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -0,0 +1,129 @@
+import gzip
+import json
+from collections import Counter, defaultdict
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from .models import ReadingHistory, ReadingHistoryDaily
+
+
+def history_cutoff(days=None):
+    if days is None:
+        days = settings.READING_HISTORY_RETENTION_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archive_path(archive_dir, day):
+    """Archives are partitioned by month, one gzip member stream per day."""
+    return Path(archive_dir) / f"{day:%Y}" / f"{day:%m}" / f"reading_history-{day:%Y-%m-%d}.jsonl.gz"
+
+
+# ---------------------------
+# 🗜️ Compact raw history
+# ---------------------------
+def compact_history(cutoff, archive_dir, chunk_size=5000):
+    """Move raw history older than ``cutoff`` into archive files and daily rollups.
+
+    Rows are processed in ``chunk_size`` batches: each batch is appended to
+    its day's archive file, folded into ``ReadingHistoryDaily`` and deleted in
+    one transaction. Archived lines carry the original row id, so a batch
+    re-archived after a failed delete can be de-duplicated downstream.
+    """
+    totals = {'rows': 0, 'chunks': 0, 'files': set()}
+    while True:
+        rows = list(
+            ReadingHistory.objects.filter(read_at__lt=cutoff)
+            .order_by('id')
+            .values('id', 'user_id', 'article_id', 'article__category_id', 'read_at')[:chunk_size]
+        )
+        if not rows:
+            break
+
+        totals['files'].update(_archive_rows(rows, archive_dir))
+        with transaction.atomic():
+            _rollup_rows(rows)
+            ReadingHistory.objects.filter(id__in=[row['id'] for row in rows]).delete()
+
+        totals['rows'] += len(rows)
+        totals['chunks'] += 1
+    return totals
+
+
+def _archive_rows(rows, archive_dir):
+    by_day = defaultdict(list)
+    for row in rows:
+        by_day[timezone.localtime(row['read_at']).date()].append(row)
+
+    paths = []
+    for day, day_rows in sorted(by_day.items()):
+        path = archive_path(archive_dir, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'at', encoding='utf-8') as fh:
+            for row in day_rows:
+                fh.write(json.dumps({
+                    'id': row['id'],
+                    'user_id': row['user_id'],
+                    'article_id': row['article_id'],
+                    'category_id': row['article__category_id'],
+                    'read_at': row['read_at'].isoformat(),
+                }) + '\n')
+        paths.append(path)
+    return paths
+
+
+def _rollup_rows(rows):
+    counts = Counter(
+        (row['user_id'], row['article__category_id'], timezone.localtime(row['read_at']).date())
+        for row in rows
+    )
+    existing = {
+        (rollup.user_id, rollup.category_id, rollup.day): rollup
+        for rollup in ReadingHistoryDaily.objects.filter(
+            user_id__in={user_id for user_id, _, _ in counts},
+            day__in={day for _, _, day in counts},
+        )
+    }
+
+    to_update, to_create = [], []
+    for key, count in counts.items():
+        rollup = existing.get(key)
+        if rollup is None:
+            user_id, category_id, day = key
+            to_create.append(ReadingHistoryDaily(user_id=user_id, category_id=category_id, day=day, count=count))
+        else:
+            rollup.count += count
+            to_update.append(rollup)
+
+    ReadingHistoryDaily.objects.bulk_update(to_update, ['count'])
+    ReadingHistoryDaily.objects.bulk_create(to_create)
+
+
+# ---------------------------
+# 📊 Category affinity
+# ---------------------------
+def category_read_counts(user):
+    """Reads per category for ``user``, combining raw history and rollups.
+
+    One query: the raw and rolled-up totals are fetched as a UNION ALL.
+    """
+    raw = (
+        ReadingHistory.objects.filter(user=user)
+        .values_list('article__category_id')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    rolled = (
+        ReadingHistoryDaily.objects.filter(user=user)
+        .values_list('category_id')
+        .annotate(total=Sum('count'))
+        .order_by()
+    )
+    counts = Counter()
+    for category_id, total in raw.union(rolled, all=True):
+        counts[category_id] += total
+    return counts
@@ -0,0 +1,56 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_pinned = ContextVar('news_db_pinned', default=False)
+
+
+@contextmanager
+def use_primary():
+    """Send every read in this block (or decorated function) to the primary."""
+    token = _pinned.set(True)
+    try:
+        yield
+    finally:
+        _pinned.reset(token)
+
+
+def pin_primary(request):
+    """Keep this client's reads on the primary for REPLICA_PIN_SECONDS after a
+    write the replicas may not have seen yet."""
+    request._pin_primary = True
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+# ---------------------------
+# 🔀 Primary / replica router
+# ---------------------------
+class PrimaryReplicaRouter:
+    """Reads go to a random alias from ``settings.DATABASE_REPLICAS``, writes
+    to the primary. Reads stay on the primary while pinned or inside a
+    transaction, so a request never reads behind its own writes."""
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if not replicas or _pinned.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *getattr(settings, 'DATABASE_REPLICAS', [])}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
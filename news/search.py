@@ -0,0 +1,105 @@
+from django.db import connections
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from django.utils.text import smart_split, unescape_string_literal
+
+ARTICLE_FTS_TABLE = 'news_article_fts'
+
+# The triggers migration 0015 created. SQLite drops a table's triggers when
+# a migration rebuilds it (most AlterField/RemoveField operations), so they
+# are checked, and restored, after every migrate.
+SEARCH_TRIGGERS = {
+    'news_article_fts_ai': """
+        CREATE TRIGGER news_article_fts_ai AFTER INSERT ON news_article BEGIN
+            INSERT INTO news_article_fts(rowid, title, content, summary)
+            VALUES (new.id, new.title, new.content, new.summary);
+        END
+    """,
+    'news_article_fts_ad': """
+        CREATE TRIGGER news_article_fts_ad AFTER DELETE ON news_article BEGIN
+            INSERT INTO news_article_fts(news_article_fts, rowid, title, content, summary)
+            VALUES ('delete', old.id, old.title, old.content, old.summary);
+        END
+    """,
+    'news_article_fts_au': """
+        CREATE TRIGGER news_article_fts_au AFTER UPDATE OF title, content, summary ON news_article BEGIN
+            INSERT INTO news_article_fts(news_article_fts, rowid, title, content, summary)
+            VALUES ('delete', old.id, old.title, old.content, old.summary);
+            INSERT INTO news_article_fts(rowid, title, content, summary)
+            VALUES (new.id, new.title, new.content, new.summary);
+        END
+    """,
+    'news_article_source_ai': """
+        CREATE TRIGGER news_article_source_ai AFTER INSERT ON news_article BEGIN
+            INSERT OR IGNORE INTO news_source(name) VALUES (new.source);
+        END
+    """,
+    'news_article_source_au': """
+        CREATE TRIGGER news_article_source_au AFTER UPDATE OF source ON news_article BEGIN
+            INSERT OR IGNORE INTO news_source(name) VALUES (new.source);
+        END
+    """,
+}
+
+
+def has_search_index(using='default'):
+    """Whether the FTS5 article index from migration 0015 exists on ``using``."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        return ARTICLE_FTS_TABLE in connection.introspection.table_names(cursor)
+
+
+def ensure_search_triggers(using='default'):
+    """Recreate missing search/source triggers; returns the names restored.
+
+    Writes made while a trigger was missing are caught up: the FTS index is
+    rebuilt and missing source names are inserted.
+    """
+    if not has_search_index(using):
+        return []
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'news_article'")
+        present = {row[0] for row in cursor.fetchall()}
+        missing = [name for name in SEARCH_TRIGGERS if name not in present]
+        for name in missing:
+            cursor.execute(SEARCH_TRIGGERS[name])
+        if any(name.startswith('news_article_fts') for name in missing):
+            cursor.execute(f"INSERT INTO {ARTICLE_FTS_TABLE}({ARTICLE_FTS_TABLE}) VALUES ('rebuild')")
+        if any(name.startswith('news_article_source') for name in missing):
+            cursor.execute("INSERT OR IGNORE INTO news_source(name) SELECT DISTINCT source FROM news_article")
+    return missing
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using='default', **kwargs):
+    if sender.name == 'news':
+        ensure_search_triggers(using)
+
+
+def fts_query(search_term):
+    """An FTS5 MATCH expression requiring every term, each as a prefix.
+
+    Terms are split like the admin's search box ("quoted phrases" stay
+    together) and quoted, so FTS5 operators typed by users match literally.
+    """
+    terms = []
+    for bit in smart_split(search_term):
+        if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+            bit = unescape_string_literal(bit)
+        if bit.strip():
+            terms.append('"{}"*'.format(bit.replace('"', '""')))
+    return ' '.join(terms)
+
+
+def search_articles(queryset, search_term):
+    """Narrow an Article ``queryset`` to rows whose title, content or summary match."""
+    query = fts_query(search_term)
+    if not query:
+        return queryset
+    return queryset.filter(pk__in=RawSQL(
+        f"SELECT rowid FROM {ARTICLE_FTS_TABLE} WHERE {ARTICLE_FTS_TABLE} MATCH %s", [query],
+    ))
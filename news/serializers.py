@@ -1,12 +1,36 @@
+from django.urls import reverse
 from rest_framework import serializers
 from .models import Article, Category, UserPreference
 
 
+def audio_link(article_id, request=None):
+    """Stable URL for an article's audio; it redirects to the storage URL.
+
+    Storage URLs may be presigned and expire, while API responses are cached
+    and revalidated against ``updated_at`` only, so they never embed them.
+    """
+    url = reverse('api_article_audio', kwargs={'pk': article_id})
+    return request.build_absolute_uri(url) if request else url
+
+
 class ArticleSerializer(serializers.ModelSerializer):
+    audio_file = serializers.SerializerMethodField()
+
     class Meta:
         model = Article
         fields = ['id', 'title', 'summary', 'content', 'author', 'published_date', 'category', 'audio_file']
 
+    def get_audio_file(self, article):
+        if not article.audio_file:
+            return None
+        return audio_link(article.pk, self.context.get('request'))
+
+
+class ModerationQueueSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Article
+        fields = ['id', 'title', 'teaser', 'source', 'author', 'link', 'category', 'published_date', 'created_at']
+
 
 class UserPreferenceSerializer(serializers.ModelSerializer):
     class Meta:
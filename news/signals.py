@@ -0,0 +1,7 @@
+from django.dispatch import Signal
+
+# Sent with ``article_ids`` whenever articles are approved or unapproved,
+# whether one at a time, from the admin or in bulk. QuerySet.update() does
+# not fire post_save, so moderation code sends these explicitly.
+articles_approved = Signal()
+articles_unapproved = Signal()
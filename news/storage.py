@@ -0,0 +1,309 @@
+import hashlib
+import hmac
+import mimetypes
+import os
+import threading
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import Storage, storages
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import LazyObject, empty
+
+AUDIO_STORAGE_ALIAS = 'audio'
+EMPTY_PAYLOAD_HASH = hashlib.sha256(b'').hexdigest()
+UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
+
+
+class StorageError(Exception):
+    """The object store answered with an error."""
+
+
+# ---------------------------
+# ✍️ AWS Signature Version 4
+# ---------------------------
+def _uri_encode(value, safe='-_.~'):
+    return quote(value, safe=safe)
+
+
+def _canonical_query(params):
+    return '&'.join(f"{_uri_encode(k)}={_uri_encode(str(v))}" for k, v in sorted(params.items()))
+
+
+def _signing_key(secret_key, date_stamp, region, service):
+    key = f"AWS4{secret_key}".encode()
+    for part in (date_stamp, region, service, 'aws4_request'):
+        key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+    return key
+
+
+def _signature(secret_key, region, service, amz_date, canonical_request):
+    scope = f"{amz_date[:8]}/{region}/{service}/aws4_request"
+    string_to_sign = '\n'.join([
+        'AWS4-HMAC-SHA256', amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest(),
+    ])
+    key = _signing_key(secret_key, amz_date[:8], region, service)
+    return scope, hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+
+def sign_request(method, url, params, headers, payload_hash, access_key, secret_key, region,
+                 service='s3', now=None):
+    """Headers for an SigV4 ``Authorization``-signed request.
+
+    ``url`` must already be URI-encoded (see ``S3Storage._object_url``); its
+    path is signed as-is. ``headers`` must not include Host; it is taken
+    from ``url``. Returns a
+    new dict with ``x-amz-date``, ``x-amz-content-sha256`` and
+    ``Authorization`` added.
+    """
+    amz_date = (now or datetime.now(dt_timezone.utc)).strftime('%Y%m%dT%H%M%SZ')
+    parts = urlsplit(url)
+    signed = {k.lower(): str(v).strip() for k, v in headers.items()}
+    signed.update({'host': parts.netloc, 'x-amz-content-sha256': payload_hash, 'x-amz-date': amz_date})
+    names = sorted(signed)
+    canonical_request = '\n'.join([
+        method,
+        parts.path or '/',
+        _canonical_query(params),
+        ''.join(f"{name}:{signed[name]}\n" for name in names),
+        ';'.join(names),
+        payload_hash,
+    ])
+    scope, signature = _signature(secret_key, region, service, amz_date, canonical_request)
+    result = {k: v for k, v in signed.items() if k != 'host'}
+    result['Authorization'] = (
+        f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, SignedHeaders={';'.join(names)}, Signature={signature}"
+    )
+    return result
+
+
+def presign_url(method, url, access_key, secret_key, region, expires=3600, service='s3', now=None):
+    """``url`` with SigV4 query-string authentication, valid for ``expires`` seconds.
+
+    Like ``sign_request``, ``url`` must already be URI-encoded.
+    """
+    amz_date = (now or datetime.now(dt_timezone.utc)).strftime('%Y%m%dT%H%M%SZ')
+    parts = urlsplit(url)
+    params = {
+        'X-Amz-Algorithm': 'AWS4-HMAC-SHA256',
+        'X-Amz-Credential': f"{access_key}/{amz_date[:8]}/{region}/{service}/aws4_request",
+        'X-Amz-Date': amz_date,
+        'X-Amz-Expires': str(expires),
+        'X-Amz-SignedHeaders': 'host',
+    }
+    canonical_request = '\n'.join([
+        method,
+        parts.path or '/',
+        _canonical_query(params),
+        f"host:{parts.netloc}\n",
+        'host',
+        UNSIGNED_PAYLOAD,
+    ])
+    _, signature = _signature(secret_key, region, service, amz_date, canonical_request)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}?{_canonical_query(params)}&X-Amz-Signature={signature}"
+
+
+# ---------------------------
+# 🪣 S3-compatible storage
+# ---------------------------
+@deconstructible(path='news.storage.S3Storage')
+class S3Storage(Storage):
+    """Django storage on any S3-compatible object store (AWS, MinIO, R2...).
+
+    Requests are signed with SigV4 over one keep-alive ``requests.Session``.
+    Objects larger than ``part_size`` are uploaded with multipart upload, one
+    part in memory at a time, and the upload is aborted if a part fails.
+    ``url()`` returns ``public_url + key`` when ``public_url`` is set and a
+    presigned GET valid for ``url_expires`` seconds otherwise. With
+    ``cache_dir`` set, opened objects are kept on local disk (read-through),
+    trimmed oldest first to ``cache_max_bytes``.
+    """
+
+    min_part_size = 5 * 1024 * 1024  # S3's floor for every part but the last
+
+    def __init__(self, endpoint_url, bucket, access_key, secret_key, region='us-east-1', prefix='',
+                 addressing_style='path', public_url=None, url_expires=3600, part_size=8 * 1024 * 1024,
+                 cache_dir=None, cache_max_bytes=512 * 1024 * 1024, timeout=30):
+        self.endpoint_url = endpoint_url.rstrip('/')
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.prefix = prefix.strip('/')
+        self.addressing_style = addressing_style
+        self.public_url = public_url.rstrip('/') + '/' if public_url else None
+        self.url_expires = url_expires
+        self.part_size = part_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_max_bytes = cache_max_bytes
+        self.timeout = timeout
+        self._session = None
+        self._lock = threading.Lock()
+
+    # Requests ------------------------------------------------------------
+    def _key(self, name):
+        name = name.replace('\\', '/').lstrip('/')
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def _object_url(self, key):
+        parts = urlsplit(self.endpoint_url)
+        encoded = _uri_encode(key, safe='/-_.~')
+        if self.addressing_style == 'virtual':
+            return f"{parts.scheme}://{self.bucket}.{parts.netloc}/{encoded}"
+        return f"{self.endpoint_url}/{self.bucket}/{encoded}"
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+        return self._session
+
+    def _request(self, method, key, params=None, data=b'', headers=None, stream=False, ok=(200, 204)):
+        params = params or {}
+        payload_hash = hashlib.sha256(data).hexdigest() if data else EMPTY_PAYLOAD_HASH
+        url = self._object_url(key)
+        signed = sign_request(method, url, params, headers or {}, payload_hash,
+                              self.access_key, self.secret_key, self.region)
+        response = self.session.request(method, url, params=_canonical_query(params) or None, data=data or None,
+                                        headers=signed, stream=stream, timeout=self.timeout)
+        if response.status_code not in ok:
+            response.close()
+            raise StorageError(f"{method} {key}: HTTP {response.status_code}")
+        return response
+
+    # Storage API -----------------------------------------------------------
+    def _save(self, name, content):
+        key = self._key(name)
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        part_size = max(self.part_size, self.min_part_size)
+        first = content.read(part_size)
+        if len(first) < part_size:
+            self._request('PUT', key, data=first, headers={'content-type': content_type})
+        else:
+            self._multipart_upload(key, first, content, content_type, part_size)
+        self._drop_cached(key)
+        return name
+
+    def _multipart_upload(self, key, first, content, content_type, part_size):
+        response = self._request('POST', key, params={'uploads': ''}, headers={'content-type': content_type})
+        upload_id = _xml_text(response.content, 'UploadId')
+        etags = []
+        try:
+            chunk = first
+            while chunk:
+                number = len(etags) + 1
+                part = self._request('PUT', key, params={'partNumber': number, 'uploadId': upload_id}, data=chunk)
+                etags.append((number, part.headers['ETag']))
+                chunk = content.read(part_size)
+            body = '<CompleteMultipartUpload>' + ''.join(
+                f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>" for number, etag in etags
+            ) + '</CompleteMultipartUpload>'
+            response = self._request('POST', key, params={'uploadId': upload_id}, data=body.encode())
+            if b'<Error>' in response.content:  # S3 may report failure inside a 200
+                raise StorageError(f"Completing upload of {key} failed")
+        except Exception:
+            self._request('DELETE', key, params={'uploadId': upload_id})
+            raise
+
+    def _open(self, name, mode='rb'):
+        if 'w' in mode or 'a' in mode:
+            raise ValueError("S3Storage files are read-only; use save().")
+        key = self._key(name)
+        if self.cache_dir is None:
+            return ContentFile(self._request('GET', key).content, name=name)
+
+        path = self._cache_path(key)
+        if not path.exists():
+            self._fill_cache(key, path)
+        else:
+            os.utime(path)  # keep recently read objects when trimming
+        return File(path.open('rb'), name=name)
+
+    def delete(self, name):
+        key = self._key(name)
+        self._request('DELETE', key, ok=(200, 204, 404))
+        self._drop_cached(key)
+
+    def exists(self, name):
+        return self._request('HEAD', self._key(name), ok=(200, 404)).status_code == 200
+
+    def size(self, name):
+        return int(self._request('HEAD', self._key(name)).headers['Content-Length'])
+
+    def url(self, name):
+        key = self._key(name)
+        if self.public_url:
+            return self.public_url + _uri_encode(key, safe='/-_.~')
+        return presign_url('GET', self._object_url(key), self.access_key, self.secret_key, self.region,
+                           expires=self.url_expires)
+
+    # Read-through cache ------------------------------------------------------
+    def _cache_path(self, key):
+        return self.cache_dir / hashlib.sha256(f"{self.bucket}/{key}".encode()).hexdigest()
+
+    def _fill_cache(self, key, path):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with self._request('GET', key, stream=True) as response, tmp.open('wb') as fh:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                fh.write(chunk)
+        tmp.replace(path)
+        self._trim_cache()
+
+    def _drop_cached(self, key):
+        if self.cache_dir is not None:
+            self._cache_path(key).unlink(missing_ok=True)
+
+    def _trim_cache(self):
+        entries = []
+        for path in self.cache_dir.iterdir():
+            if path.suffix != '.tmp':
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def _xml_text(body, tag):
+    for element in ElementTree.fromstring(body).iter():
+        if element.tag.rsplit('}', 1)[-1] == tag:
+            return element.text
+    raise StorageError(f"No <{tag}> in response")
+
+
+# ---------------------------
+# 🎧 Audio storage
+# ---------------------------
+class AudioStorage(LazyObject):
+    """``storages['audio']``, resolved on first use and again after STORAGES changes."""
+
+    def _setup(self):
+        self._wrapped = storages[AUDIO_STORAGE_ALIAS]
+
+
+audio_storage = AudioStorage()
+
+
+def get_audio_storage():
+    """``storage=`` callable for ``Article.audio_file``."""
+    return audio_storage
+
+
+@receiver(setting_changed)
+def reset_audio_storage(setting, **kwargs):
+    if setting in ('STORAGES', 'MEDIA_ROOT', 'MEDIA_URL'):
+        audio_storage._wrapped = empty
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.dispatch import receiver
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from .models import Article
+from .signals import articles_approved
+
+REPLAY_LIMIT = 200
+
+
+# ---------------------------
+# 📡 Pub/sub backends
+# ---------------------------
+class LocalPubSub:
+    """In-process stand-in for a cross-process channel. Fine for a single
+    worker and for tests; use ``RedisPubSub`` when running several."""
+
+    def __init__(self):
+        self._handlers = []
+
+    def publish(self, message):
+        for handler in list(self._handlers):
+            handler(message)
+
+    def subscribe(self, handler):
+        self._handlers.append(handler)
+
+
+class RedisPubSub:
+    """Fans messages out to every process through a Redis channel."""
+
+    def __init__(self, url='redis://localhost:6379/0', channel='bytenews:articles'):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self.channel = channel
+
+    def publish(self, message):
+        self._client.publish(self.channel, json.dumps(message, cls=DjangoJSONEncoder))
+
+    def subscribe(self, handler):
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self.channel: lambda raw: handler(json.loads(raw['data']))})
+        pubsub.run_in_thread(daemon=True, sleep_time=1)
+
+
+# ---------------------------
+# 📣 Broadcaster
+# ---------------------------
+class ArticleBroadcaster:
+    """Keeps the last ``history`` events for ``Last-Event-ID`` resume and
+    hands new ones to every connected client's queue. Idle clients cost a
+    queue each and no database work."""
+
+    def __init__(self, pubsub, history=1000, queue_size=100):
+        self.pubsub = pubsub
+        self.queue_size = queue_size
+        self._events = deque(maxlen=history)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._last_id = 0
+        pubsub.subscribe(self._deliver)
+
+    def publish(self, payload):
+        with self._lock:
+            self._last_id = max(self._last_id + 1, time.time_ns() // 1_000_000)
+            event_id = self._last_id
+        self.pubsub.publish({'id': event_id, 'data': payload})
+
+    def subscribe(self, loop, last_event_id=None):
+        """Register a client. Returns its queue, the buffered events after
+        ``last_event_id`` and whether older events were already evicted."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.add((loop, queue))
+            if last_event_id is None:
+                return queue, [], False
+            backlog = [event for event in self._events if event['id'] > last_event_id]
+            gap = not self._events or self._events[0]['id'] > last_event_id
+        return queue, backlog, gap
+
+    def unsubscribe(self, loop, queue):
+        with self._lock:
+            self._subscribers.discard((loop, queue))
+
+    def _deliver(self, event):
+        with self._lock:
+            self._events.append(event)
+            self._last_id = max(self._last_id, event['id'])
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(self._offer, queue, event)
+
+    @staticmethod
+    def _offer(queue, event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind is dropped; it reconnects with
+            # Last-Event-ID and resumes from the buffer or the database.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+
+_broadcaster = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_broadcaster():
+    global _broadcaster
+    if _broadcaster is None:
+        with _broadcaster_lock:
+            if _broadcaster is None:
+                config = settings.NEWS_PUBSUB
+                pubsub = import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+                _broadcaster = ArticleBroadcaster(pubsub, history=settings.NEWS_STREAM_HISTORY)
+    return _broadcaster
+
+
+# ---------------------------
+# 📰 Event payloads
+# ---------------------------
+def _payloads(queryset):
+    rows = queryset.values('id', 'title', 'teaser', 'category__name', 'published_date', 'updated_at')
+    return [
+        ({
+            'id': row['id'],
+            'title': row['title'],
+            'teaser': row['teaser'],
+            'category': row['category__name'],
+            'published_date': row['published_date'],
+            'url': reverse('api_article_detail', kwargs={'pk': row['id']}),
+        }, row['updated_at'])
+        for row in rows
+    ]
+
+
+def publish_approved(article_ids):
+    broadcaster = get_broadcaster()
+    for payload, _ in _payloads(Article.objects.filter(pk__in=article_ids, approved=True).order_by('id')):
+        broadcaster.publish(payload)
+
+
+def replay_since(last_event_id, limit=REPLAY_LIMIT):
+    """Rebuild events evicted from the buffer from approved rows changed since
+    the event time (event ids are millisecond timestamps)."""
+    since = datetime.fromtimestamp(last_event_id / 1000, tz=dt_timezone.utc)
+    queryset = Article.objects.filter(approved=True, updated_at__gt=since).order_by('updated_at')[:limit]
+    return [
+        {'id': int(updated_at.timestamp() * 1000), 'data': payload}
+        for payload, updated_at in _payloads(queryset)
+    ]
+
+
+def format_event(event):
+    data = json.dumps(event['data'], cls=DjangoJSONEncoder)
+    return f"id: {event['id']}\nevent: article\ndata: {data}\n\n"
+
+
+@receiver(articles_approved)
+def broadcast_approved_articles(sender, article_ids, **kwargs):
+    transaction.on_commit(lambda: publish_approved(article_ids))
@@ -0,0 +1,121 @@
+import logging
+import queue
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import close_old_connections
+from django.dispatch import receiver
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+TASKS = REGISTRY.counter(
+    'bytenews_tasks_total', 'Background tasks by outcome: queued, dropped, succeeded, failed.',
+    labels=('task', 'outcome'),
+)
+
+
+def _task_name(func):
+    return getattr(func, '__qualname__', repr(func))
+
+
+# ---------------------------
+# 🧵 In-process task queue
+# ---------------------------
+class TaskQueue:
+    """Runs callables on a few daemon worker threads.
+
+    Like the reading history recorder, the backlog is bounded and a full
+    queue drops work instead of blocking the caller, so tasks must be safe to
+    lose and to repeat. With ``eager=True`` tasks run inline in the caller
+    (tests, management commands).
+    """
+
+    def __init__(self, workers=1, max_backlog=10000, eager=False):
+        self.workers = workers
+        self.eager = eager
+        self._queue = queue.Queue(maxsize=max_backlog)
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def enqueue(self, func, *args, **kwargs):
+        name = _task_name(func)
+        if self.eager:
+            self._run_task(name, func, args, kwargs)
+            return True
+        try:
+            self._queue.put_nowait((name, func, args, kwargs))
+        except queue.Full:
+            TASKS.inc(task=name, outcome='dropped')
+            return False
+        TASKS.inc(task=name, outcome='queued')
+        self._ensure_workers()
+        return True
+
+    def join(self):
+        """Block until every queued task has run."""
+        self._queue.join()
+
+    def backlog(self):
+        return self._queue.qsize()
+
+    def _run_task(self, name, func, args, kwargs):
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            logger.exception("Background task %s failed", name)
+            TASKS.inc(task=name, outcome='failed')
+        else:
+            TASKS.inc(task=name, outcome='succeeded')
+
+    def _ensure_workers(self):
+        if len(self._threads) >= self.workers:
+            return
+        with self._lock:
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(
+                    target=self._work, name=f'news-tasks-{len(self._threads)}', daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def _work(self):
+        while True:
+            name, func, args, kwargs = self._queue.get()
+            try:
+                self._run_task(name, func, args, kwargs)
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+
+_task_queue = None
+_task_queue_lock = threading.Lock()
+
+
+def get_task_queue():
+    global _task_queue
+    if _task_queue is None:
+        with _task_queue_lock:
+            if _task_queue is None:
+                config = settings.NEWS_TASKS
+                _task_queue = TaskQueue(
+                    workers=config.get('WORKERS', 1),
+                    max_backlog=config.get('MAX_BACKLOG', 10000),
+                    eager=config.get('EAGER', False),
+                )
+    return _task_queue
+
+
+def enqueue(func, *args, **kwargs):
+    """Run ``func(*args, **kwargs)`` in the background; False if it was dropped."""
+    return get_task_queue().enqueue(func, *args, **kwargs)
+
+
+@receiver(setting_changed)
+def reset_task_queue(setting, **kwargs):
+    global _task_queue
+    if setting == 'NEWS_TASKS':
+        _task_queue = None
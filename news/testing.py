@@ -0,0 +1,75 @@
+from contextlib import ContextDecorator
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models.signals import post_init
+from django.test.runner import DiscoverRunner
+from django.test.utils import CaptureQueriesContext, override_settings
+
+
+# ---------------------------
+# 🏃 Test runner
+# ---------------------------
+class NewsTestRunner(DiscoverRunner):
+    """Writes reading history synchronously while tests run.
+
+    A background flusher would write a test's reading events after its
+    transaction rolled back, against articles that no longer exist.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._sync_history = override_settings(READING_HISTORY_WRITE_BEHIND=False)
+        self._sync_history.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._sync_history.disable()
+        super().teardown_test_environment(**kwargs)
+
+
+# ---------------------------
+# 🧮 Query budgets
+# ---------------------------
+class QueryBudget(ContextDecorator):
+    """Fail when a block runs more queries or builds more model rows than allowed.
+
+    Use as ``with QueryBudget(max_queries=4, max_rows=10):`` or as a decorator.
+    Rows are counted as model instances initialised inside the block, so
+    ``values()`` rows and deferred-field reloads show up only as queries.
+    """
+
+    def __init__(self, max_queries=None, max_rows=None, using=DEFAULT_DB_ALIAS):
+        self.max_queries = max_queries
+        self.max_rows = max_rows
+        self.using = using
+
+    def __enter__(self):
+        self.rows = 0
+        self._capture = CaptureQueriesContext(connections[self.using])
+        self._capture.__enter__()
+        post_init.connect(self._count_row, weak=False)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        post_init.disconnect(self._count_row)
+        self._capture.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return False
+
+        problems = []
+        if self.max_queries is not None and self.queries > self.max_queries:
+            problems.append(f"{self.queries} queries (budget {self.max_queries})")
+        if self.max_rows is not None and self.rows > self.max_rows:
+            problems.append(f"{self.rows} rows (budget {self.max_rows})")
+        if problems:
+            sql = '\n'.join(
+                f"  {i}. {query['sql']}" for i, query in enumerate(self._capture.captured_queries, 1)
+            )
+            raise AssertionError(f"Query budget exceeded: {', '.join(problems)}\n{sql}")
+        return False
+
+    @property
+    def queries(self):
+        return len(self._capture.captured_queries)
+
+    def _count_row(self, sender, **kwargs):
+        self.rows += 1
@@ -0,0 +1,105 @@
+import math
+from html.parser import HTMLParser
+
+from django.utils.text import Truncator
+
+TEASER_WORDS = 30
+WORDS_PER_MINUTE = 200
+
+
+# ---------------------------
+# ✂️ Teasers and reading time
+# ---------------------------
+def build_teaser(text, num_words=TEASER_WORDS):
+    """Same output as the ``truncatewords`` filter, computed once at save time."""
+    if not text:
+        return ""
+    return Truncator(text).words(num_words)
+
+
+def estimate_reading_time(text, words_per_minute=WORDS_PER_MINUTE):
+    """Whole minutes to read ``text``, never less than one."""
+    if not text:
+        return 1
+    return max(1, math.ceil(len(text.split()) / words_per_minute))
+
+
+# ---------------------------
+# 🧼 HTML to text
+# ---------------------------
+# Strings inside these never show up in BeautifulSoup's get_text().
+SKIPPED_TEXT_TAGS = frozenset({'script', 'style', 'template', 'rp', 'rt'})
+
+
+class TextExtractor(HTMLParser):
+    """Incremental HTML-to-text with ``get_text(separator, strip=True)`` semantics.
+
+    Every text node between tags is stripped, empty ones are dropped and the
+    rest are joined with ``separator``; no tree is built. ``feed()`` may be
+    called with arbitrary chunks. Entities are decoded per HTML5, so unknown
+    ones such as ``&foo;`` keep their semicolon (BeautifulSoup drops it).
+    """
+
+    def __init__(self, separator=' '):
+        super().__init__(convert_charrefs=True)
+        self.separator = separator
+        self._parts = []
+        self._buffer = []
+        self._skipping = []
+
+    def _end_string(self):
+        if self._buffer:
+            text = ''.join(self._buffer).strip()
+            self._buffer.clear()
+            if text:
+                self._parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._end_string()
+        if tag in SKIPPED_TEXT_TAGS:
+            self._skipping.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_string()
+
+    def handle_endtag(self, tag):
+        self._end_string()
+        if tag in self._skipping:
+            while self._skipping.pop() != tag:
+                pass
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self._buffer.append(data)
+
+    def handle_comment(self, data):
+        self._end_string()
+
+    def handle_decl(self, decl):
+        self._end_string()
+
+    def handle_pi(self, data):
+        self._end_string()
+
+    def unknown_decl(self, data):
+        self._end_string()
+        if data.startswith('CDATA[') and not self._skipping:
+            self._buffer.append(data[len('CDATA['):])
+            self._end_string()
+
+    def close(self):
+        super().close()
+        self._end_string()
+
+    def get_text(self):
+        return self.separator.join(self._parts)
+
+
+def html_to_text(raw_html, separator=' '):
+    """``BeautifulSoup(raw_html, 'html.parser').get_text(separator, strip=True)`` without the tree."""
+    if not raw_html:
+        return ""
+    extractor = TextExtractor(separator)
+    extractor.feed(raw_html)
+    extractor.close()
+    return extractor.get_text()
@@ -0,0 +1,188 @@
+import bisect
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Article, UserPreference
+from .signals import articles_approved, articles_unapproved
+
+FANOUT_CHUNK_SIZE = 500
+
+
+def timeline_key(user_id):
+    return f"timeline:{user_id}"
+
+
+def preferences_key(user_id):
+    return f"timeline:prefs:{user_id}"
+
+
+# ---------------------------
+# ⭐ Preferred categories
+# ---------------------------
+def preferred_category_ids(user):
+    """Category ids the user follows, or ``None`` if they have no preferences yet."""
+    key = preferences_key(user.pk)
+    ids = cache.get(key)
+    if ids is None:
+        rows = list(
+            UserPreference.objects.filter(user=user).values_list('preferred_categories', flat=True)
+        )
+        ids = sorted(row for row in rows if row is not None) if rows else False
+        cache.set(key, ids, settings.TIMELINE_TTL)
+    return None if ids is False else ids
+
+
+# ---------------------------
+# 🧵 Timelines
+# ---------------------------
+def get_timeline(user, category_ids):
+    """Newest-first ``(published_ts, article_id)`` entries for ``user``.
+
+    Users following at most TIMELINE_FANOUT_MAX_CATEGORIES categories keep a
+    long-lived timeline that approvals are pushed into. Everyone else is
+    served fan-out-on-read: the list is rebuilt from the database and only
+    cached briefly.
+    """
+    key = timeline_key(user.pk)
+    entries = cache.get(key)
+    if entries is None:
+        entries = _build_timeline(category_ids)
+        cache.set(key, entries, _timeline_ttl(category_ids))
+    return entries
+
+
+def _timeline_ttl(category_ids):
+    if len(category_ids) > settings.TIMELINE_FANOUT_MAX_CATEGORIES:
+        return settings.TIMELINE_READ_TTL
+    return settings.TIMELINE_TTL
+
+
+def _build_timeline(category_ids):
+    rows = (
+        Article.objects.filter(approved=True, category_id__in=category_ids)
+        .order_by('-published_date', '-id')
+        .values_list('published_date', 'id')[:settings.TIMELINE_MAX_LENGTH]
+    )
+    return [(published.timestamp(), article_id) for published, article_id in rows]
+
+
+def _push(entries, new_entries):
+    # Stored newest first; bisect on negated keys keeps insertion O(log n).
+    keys = [(-ts, -article_id) for ts, article_id in entries]
+    for ts, article_id in new_entries:
+        if (ts, article_id) in entries:
+            continue
+        position = bisect.bisect_left(keys, (-ts, -article_id))
+        keys.insert(position, (-ts, -article_id))
+        entries.insert(position, (ts, article_id))
+    del entries[settings.TIMELINE_MAX_LENGTH:]
+    return entries
+
+
+def fan_out(article_ids, remove=False):
+    """Push (or remove) articles into the cached timelines of their followers.
+
+    Only timelines already in the cache are touched; a missing timeline is
+    rebuilt from the database on its next read. Fan-out-on-read users
+    (following more than TIMELINE_FANOUT_MAX_CATEGORIES) are never pushed
+    into, so their timelines keep the short TIMELINE_READ_TTL; removals drop
+    their cached timeline instead.
+    """
+    rows = Article.objects.filter(pk__in=article_ids).values_list('id', 'category_id', 'published_date')
+    by_category = {}
+    for article_id, category_id, published in rows:
+        by_category.setdefault(category_id, []).append((published.timestamp(), article_id))
+    return _fan_out(by_category, remove)
+
+
+def _fan_out(by_category, remove):
+    if not by_category:
+        return 0
+
+    Through = UserPreference.preferred_categories.through
+    followers = {}
+    for user_id, category_id in Through.objects.filter(category_id__in=by_category).values_list(
+        'userpreference__user_id', 'category_id'
+    ):
+        followers.setdefault(user_id, []).extend(by_category[category_id])
+
+    touched = 0
+    user_ids = list(followers)
+    for start in range(0, len(user_ids), FANOUT_CHUNK_SIZE):
+        chunk = user_ids[start:start + FANOUT_CHUNK_SIZE]
+        read_only = set(
+            Through.objects.filter(userpreference__user_id__in=chunk)
+            .values('userpreference__user_id').annotate(followed=Count('id'))
+            .filter(followed__gt=settings.TIMELINE_FANOUT_MAX_CATEGORIES)
+            .values_list('userpreference__user_id', flat=True)
+        )
+        keys = {timeline_key(user_id): user_id for user_id in chunk if user_id not in read_only}
+        timelines = cache.get_many(keys)
+        updated = {}
+        for key, entries in timelines.items():
+            new_entries = followers[keys[key]]
+            if remove:
+                dropped = {article_id for _, article_id in new_entries}
+                updated[key] = [entry for entry in entries if entry[1] not in dropped]
+            else:
+                updated[key] = _push(entries, new_entries)
+        cache.set_many(updated, settings.TIMELINE_TTL)
+        if remove and read_only:
+            cache.delete_many([timeline_key(user_id) for user_id in read_only])
+        touched += len(updated)
+    return touched
+
+
+class TimelineFeed:
+    """Lazy sequence over a precomputed timeline, so paging a personalized
+    feed is a list slice plus a primary-key lookup for one page."""
+
+    def __init__(self, entries, queryset):
+        self.ids = [article_id for _, article_id in entries]
+        self.queryset = queryset
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            ids = self.ids[index]
+            articles = self.queryset.in_bulk(ids)
+            return [articles[article_id] for article_id in ids if article_id in articles]
+        return self[index:index + 1][0]
+
+
+# ---------------------------
+# 📣 Signal receivers
+# ---------------------------
+@receiver(articles_approved)
+def push_approved_articles(sender, article_ids, **kwargs):
+    transaction.on_commit(lambda: fan_out(article_ids))
+
+
+@receiver(articles_unapproved)
+def pull_unapproved_articles(sender, article_ids, **kwargs):
+    transaction.on_commit(lambda: fan_out(article_ids, remove=True))
+
+
+@receiver(post_delete, sender=Article)
+def pull_deleted_article(sender, instance, **kwargs):
+    # The row is gone by commit time, so the entry is built from the instance.
+    by_category = {instance.category_id: [(instance.published_date.timestamp(), instance.pk)]}
+    transaction.on_commit(lambda: _fan_out(by_category, remove=True))
+
+
+@receiver(m2m_changed, sender=UserPreference.preferred_categories.through)
+def reset_timeline_on_preference_change(sender, instance, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear') and isinstance(instance, UserPreference):
+        cache.delete_many([preferences_key(instance.user_id), timeline_key(instance.user_id)])
+
+
+@receiver([post_save, post_delete], sender=UserPreference)
+def reset_timeline_on_preference_save(sender, instance, **kwargs):
+    cache.delete_many([preferences_key(instance.user_id), timeline_key(instance.user_id)])
@@ -1,12 +1,13 @@
 from django.urls import path
+from . import async_views
 from .views import (
     ArticleListView,
     ArticleDetailView,
     generate_summary_view,
     generate_audio_view,
-    generate_audio_ajax,
     submit_summary_feedback,
-    approve_article_view
+    approve_article_view,
+    moderation_queue_view,
 )
 
 app_name = 'news'  # ✅ Required for namespaced URL reversing like 'news:detail'
@@ -24,12 +25,15 @@ urlpatterns = [
     # 🔹 Audio generation (manual)
     path('article/<int:pk>/generate-audio/', generate_audio_view, name='generate_audio'),
 
-    # 🔹 Audio generation via AJAX
-    path('article/<int:pk>/ajax/generate-audio/', generate_audio_ajax, name='generate_audio_ajax'),
+    # 🔹 Audio generation via AJAX (the non-blocking async trigger, kept at its old URL)
+    path('article/<int:pk>/ajax/generate-audio/', async_views.trigger_audio, name='generate_audio_ajax'),
 
     # 🔹 Feedback for article summary
     path('article/<int:pk>/feedback/', submit_summary_feedback, name='submit_summary_feedback'),
 
     # 🔹 Admin article approval
     path('article/<int:pk>/approve/', approve_article_view, name='approve_article'),
+
+    # 🔹 Moderation queue (staff)
+    path('moderation/', moderation_queue_view, name='moderation_queue'),
 ]
@@ -1,70 +1,74 @@
-import os
+import logging
 import string
-import feedparser
 from datetime import datetime
 from time import mktime
 from collections import Counter
-from bs4 import BeautifulSoup
-from newspaper import Article as NewsArticle, Config
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from gtts import gTTS
-from django.conf import settings
+from django.core.files.base import ContentFile
 from django.utils import timezone
-import nltk
 
-# ---------------------------
-# 🔧 Ensure NLTK resources are available
-# ---------------------------
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
+from .engines import get_nlp_engine, get_scraper
+from .fetch import FetchError
+from .metrics import SCRAPE_ARTICLES, SCRAPE_FEED_ERRORS, SCRAPE_STAGE_SECONDS
+from .models import Article
+from .text import html_to_text
+from .tts import get_tts_client
 
-try:
-    nltk.data.find("corpora/stopwords")
-except LookupError:
-    nltk.download("stopwords")
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------
 # 🧼 Clean HTML tags
 # ---------------------------
 def clean_html(raw_html):
-    if not raw_html:
-        return ""
-    soup = BeautifulSoup(raw_html, 'html.parser')
-    return soup.get_text(separator=' ', strip=True)
+    return html_to_text(raw_html)
 
 
 # ---------------------------
 # 📰 Fetch news from RSS with fallback
 # ---------------------------
 def fetch_news_from_rss(feed_url, source_name):
-    config = Config()
-    config.browser_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    config.request_timeout = 20
+    """Parsed entries of ``feed_url`` not yet stored, with full article text.
 
-    feed = feedparser.parse(feed_url)
+    Per-stage timings and per-entry outcomes are recorded in ``news.metrics``.
+    """
+    scraper = get_scraper()
+    try:
+        with SCRAPE_STAGE_SECONDS.time(source=source_name, stage='feed_fetch'):
+            feed = scraper.parse_feed(feed_url)
+    except FetchError as e:
+        logger.warning("Could not fetch feed %s: %s", feed_url, e)
+        SCRAPE_FEED_ERRORS.inc(source=source_name)
+        return []
     articles = []
 
-    for entry in feed.entries[:3]:  # Limit to 5 during dev
+    entries = [entry for entry in feed.entries[:3] if entry.get('link')]  # Limit to 5 during dev
+    # Pages already stored are never downloaded again.
+    with SCRAPE_STAGE_SECONDS.time(source=source_name, stage='dedupe'):
+        known = set(Article.objects.filter(link__in=[entry.link for entry in entries]).values_list('link', flat=True))
+    SCRAPE_ARTICLES.inc(len(known), source=source_name, outcome='skipped')
+
+    # Each new entry ends in exactly one outcome: fetched, fallback or failed.
+    for entry in entries:
+        if entry.link in known:
+            continue
         try:
             article_url = entry.link
-            news = NewsArticle(article_url, config=config)
-
+            outcome = 'fetched'
             try:
-                news.download()
-                news.parse()
-                full_content = news.text.strip()
+                with SCRAPE_STAGE_SECONDS.time(source=source_name, stage='article_fetch'):
+                    page = scraper.fetch_page(article_url)
+                with SCRAPE_STAGE_SECONDS.time(source=source_name, stage='extract'):
+                    full_content = scraper.extract_from_html(article_url, page.text)
 
                 if not full_content or len(full_content) < 200:
                     raise ValueError("Too short or empty content")
 
             except Exception as e:
-                print(f"⚠️ Newspaper scrape failed: {e}")
+                logger.info("Full-text scrape of %s failed, using the feed summary: %s", article_url, e)
+                outcome = 'fallback'
                 full_content = clean_html(entry.get('summary', '') or entry.get('description', ''))
                 if not full_content or len(full_content) < 50:
+                    SCRAPE_ARTICLES.inc(source=source_name, outcome='failed')
                     continue  # still not enough content
 
             published_time = entry.get('published_parsed')
@@ -82,8 +86,10 @@ def fetch_news_from_rss(feed_url, source_name):
             })
 
         except Exception as e:
-            print(f"⚠️ Error scraping article from {source_name}: {e}")
+            logger.warning("Error scraping article from %s: %s", source_name, e)
+            SCRAPE_ARTICLES.inc(source=source_name, outcome='failed')
             continue
+        SCRAPE_ARTICLES.inc(source=source_name, outcome=outcome)
 
     return articles
 
@@ -103,25 +109,26 @@ def generate_summary(text, article_title="", num_sentences=3):
     if not text or not isinstance(text, str):
         return "No content available to summarize."
 
-    sentences = sent_tokenize(text, language="english")
+    nlp = get_nlp_engine()
+    sentences = nlp.sent_tokenize(text)
     if len(sentences) <= num_sentences:
         return text
 
-    words = word_tokenize(clean_text(text).lower(), language="english")
-    stop_words = set(stopwords.words('english'))
+    words = nlp.word_tokenize(clean_text(text).lower())
+    stop_words = nlp.stop_words
     filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
 
     word_frequencies = Counter(filtered_words)
 
     if article_title:
-        title_words = word_tokenize(clean_text(article_title).lower(), language="english")
+        title_words = nlp.word_tokenize(clean_text(article_title).lower())
         for word in title_words:
             if word in word_frequencies:
                 word_frequencies[word] += 0.5
 
     sentence_scores = {}
     for i, sentence in enumerate(sentences):
-        for word in word_tokenize(clean_text(sentence.lower()), language="english"):
+        for word in nlp.word_tokenize(clean_text(sentence.lower())):
             if word in word_frequencies:
                 sentence_scores[i] = sentence_scores.get(i, 0) + word_frequencies[word]
         if i == 0:
@@ -137,21 +144,30 @@ def generate_summary(text, article_title="", num_sentences=3):
 # ---------------------------
 # 🔊 Generate audio summary
 # ---------------------------
-def generate_audio_summary(summary_text, article_id):
-    if not summary_text:
-        return None
+def save_audio_summary(article, audio, only_if_approved=False):
+    """Store ``audio`` as the article's audio summary; returns whether it was written.
 
-    try:
-        tts = gTTS(text=summary_text[:5000], lang='en')
-        audio_filename = f"{article_id}_summary.mp3"
-        audio_path = os.path.join(settings.MEDIA_ROOT, 'audio', audio_filename)
-        os.makedirs(os.path.dirname(audio_path), exist_ok=True)
-        tts.save(audio_path)
-
-        return f"{settings.MEDIA_URL}audio/{audio_filename}"
-    except Exception as e:
-        print(f"❌ Error generating audio: {e}")
-        return None
+    The TTS call before this is slow, so only ``audio_file`` (and
+    ``updated_at``) is written: approval and vote counters may have moved
+    meanwhile. With ``only_if_approved`` an article unapproved in the meantime
+    is left alone. The file is deleted again when no row was written.
+    """
+    article.audio_file.save(f"{article.pk}_summary.mp3", ContentFile(audio), save=False)
+    rows = Article.objects.filter(pk=article.pk)
+    if only_if_approved:
+        rows = rows.filter(approved=True)
+    if rows.update(audio_file=article.audio_file.name, updated_at=timezone.now()):
+        return True
+    article.audio_file.delete(save=False)
+    return False
+
+
+def generate_audio_summary(article, only_if_approved=False):
+    """Synthesize ``article.summary`` and store it with ``save_audio_summary``.
+
+    TTS and storage errors propagate to the caller.
+    """
+    return save_audio_summary(article, get_tts_client().synthesize(article.summary), only_if_approved)
 
 
 # ---------------------------
@@ -1,23 +1,31 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView
-from django.db.models import Q, Count
+from django.db.models import Count, Exists, OuterRef, Q
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_GET, require_POST
 from django.views.decorators.csrf import csrf_protect
 from django.contrib.admin.views.decorators import staff_member_required
-from django.core.files.base import ContentFile
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
 from django.conf import settings
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 
 
-import io
-from gtts import gTTS
-
 from .models import Article, Category, ReadingHistory, UserPreference
-from .utils import generate_summary, generate_audio_summary
+from .utils import generate_audio_summary, generate_summary
+from .feedback import record_summary_feedback
+from .history import record_reading
+from .retention import category_read_counts
+from .routers import pin_primary, use_primary
+from .changes import parse_watermark
+from .moderation import pending_articles, set_approval
+from .timelines import TimelineFeed, get_timeline, preferred_category_ids
+from .metrics import REGISTRY, label_snapshot, latest_reports, merge_snapshots, render_prometheus
+from .profiling import aggregator as profiling_aggregator
+
+RECOMMENDATION_CANDIDATES = 50  # newest timeline entries scanned for unread articles
+
 # -----------------------------
 # 📄 CACHED ARTICLE LIST VIEW
 # -----------------------------
@@ -39,9 +47,7 @@ class ArticleListView(ListView):
     ordering = ['-published_date']
 
     def get_queryset(self):
-        queryset = super().get_queryset().filter(approved=True)
-        queryset = queryset.select_related('category')
-        queryset = queryset.prefetch_related('category__articles', 'readinghistory_set')
+        queryset = super().get_queryset().filter(approved=True).defer('content')
 
         category_name = self.request.GET.get('category')
         search_query = self.request.GET.get('q')
@@ -57,16 +63,16 @@ class ArticleListView(ListView):
             )
 
         if self.request.user.is_authenticated:
-            try:
-                user_pref = self.request.user.preference
-                preferred_categories = user_pref.preferred_categories.all()
-                if preferred_categories.exists():
-                    queryset = queryset.filter(category__in=preferred_categories).distinct()
-                    messages.info(self.request, "Showing personalized articles.")
-                else:
-                    messages.info(self.request, "No preferences set. Showing all articles.")
-            except UserPreference.DoesNotExist:
+            category_ids = preferred_category_ids(self.request.user)
+            if category_ids is None:
                 messages.info(self.request, "Set your preferences to customize your feed.")
+            elif category_ids:
+                messages.info(self.request, "Showing personalized articles.")
+                if not category_name and not search_query:
+                    return TimelineFeed(get_timeline(self.request.user, category_ids), queryset)
+                queryset = queryset.filter(category_id__in=category_ids)
+            else:
+                messages.info(self.request, "No preferences set. Showing all articles.")
 
         return queryset
 
@@ -77,26 +83,30 @@ class ArticleListView(ListView):
             article_count=Count('articles')
         ).order_by('name')
 
+        context['fragment_ttl'] = settings.NEWS_FRAGMENT_CACHE_TIMEOUT
         context['current_category'] = self.request.GET.get('category', 'All')
         context['search_query'] = self.request.GET.get('q', '')
         context['recommendations'] = []
 
         if self.request.user.is_authenticated:
-            try:
-                preferred = self.request.user.preference.preferred_categories.all()
-                if preferred.exists():
-                    read_ids = ReadingHistory.objects.filter(
-                        user=self.request.user
-                    ).values_list('article_id', flat=True)
-
-                    recommended = Article.objects.filter(
-                        category__in=preferred,
-                        approved=True
-                    ).exclude(id__in=read_ids).distinct().order_by('-published_date')[:5]
-
-                    context['recommendations'] = recommended
-            except UserPreference.DoesNotExist:
-                pass
+            category_ids = preferred_category_ids(self.request.user)
+            if category_ids:
+                candidates = {
+                    article_id: position for position, (_, article_id)
+                    in enumerate(get_timeline(self.request.user, category_ids)[:RECOMMENDATION_CANDIDATES])
+                }
+                unread_categories = Article.objects.filter(pk__in=candidates).exclude(
+                    Exists(ReadingHistory.objects.filter(user=self.request.user, article=OuterRef('pk')))
+                ).values_list('id', 'category_id')
+                # Categories the user reads most (including compacted history)
+                # first, newest first within a category.
+                affinity = category_read_counts(self.request.user)
+                unread = [article_id for article_id, _ in sorted(
+                    unread_categories, key=lambda row: (-affinity[row[1]], candidates[row[0]]),
+                )][:5]
+
+                recommended = Article.objects.filter(approved=True).only('id', 'title').in_bulk(unread)
+                context['recommendations'] = [recommended[i] for i in unread if i in recommended]
 
         return context
 
@@ -111,20 +121,26 @@ class ArticleDetailView(DetailView):
     def get_object(self, queryset=None):
         obj = super().get_object(queryset)
         if self.request.user.is_authenticated:
-            ReadingHistory.objects.get_or_create(
-                user=self.request.user,
-                article=obj
-            )
+            # Reading history is never shown back right away, so this write
+            # does not pin the client to the primary.
+            record_reading(self.request.user, obj)
         return obj
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['fragment_ttl'] = settings.NEWS_FRAGMENT_CACHE_TIMEOUT
+        return context
+
 # -----------------------------
 # 📝 GENERATE SUMMARY VIEW
 # -----------------------------
 @login_required
+@use_primary()
 def generate_summary_view(request, pk):
     article = get_object_or_404(Article, pk=pk)
     article.summary = generate_summary(article.content, article.title)
-    article.save()
+    article.save(update_fields=['summary'])
+    pin_primary(request)
     messages.success(request, "Summary generated successfully!")
     return redirect('news:article_detail', pk=pk)
 
@@ -132,8 +148,10 @@ def generate_summary_view(request, pk):
 # 🎧 GENERATE AUDIO (Manual)
 # -----------------------------
 @login_required
+@use_primary()
 def generate_audio_view(request, pk):
     article = get_object_or_404(Article, pk=pk)
+    pin_primary(request)
 
     if article.audio_file:
         messages.info(request, "Audio already exists for this article.")
@@ -142,18 +160,12 @@ def generate_audio_view(request, pk):
     try:
         if not article.summary:
             article.summary = generate_summary(article.content, article.title)
-            article.save()
+            article.save(update_fields=['summary'])
 
-        tts = gTTS(text=article.summary[:5000], lang='en')
-        audio_bytes = io.BytesIO()
-        tts.write_to_fp(audio_bytes)
-        audio_bytes.seek(0)
-
-        filename = f"{article.pk}_summary.mp3"
-        article.audio_file.save(filename, ContentFile(audio_bytes.read()))
-        article.save()
-
-        messages.success(request, "Audio generated successfully!")
+        if generate_audio_summary(article):
+            messages.success(request, "Audio generated successfully!")
+        else:
+            messages.error(request, "The article was deleted while its audio was generated.")
     except Exception as e:
         messages.error(request, f"Failed to generate audio: {e}")
 
@@ -165,16 +177,16 @@ def generate_audio_view(request, pk):
 @login_required
 @require_POST
 def submit_summary_feedback(request, pk):
-    article = get_object_or_404(Article, pk=pk)
+    article = get_object_or_404(Article.objects.only('pk'), pk=pk)
     feedback_type = request.POST.get('feedback')
 
-    if feedback_type == 'helpful':
-        article.summary_helpful += 1
-    elif feedback_type == 'not_helpful':
-        article.summary_not_helpful += 1
+    if feedback_type not in ('helpful', 'not_helpful'):
+        messages.error(request, "Unknown feedback option.")
+    elif record_summary_feedback(request.user, article.pk, helpful=feedback_type == 'helpful'):
+        messages.success(request, "Thanks for your feedback!")
+    else:
+        messages.info(request, "You've already rated this summary.")
 
-    article.save()
-    messages.success(request, "Thanks for your feedback!")
     return redirect('news:article_detail', pk=pk)
 
 # -----------------------------
@@ -184,33 +196,70 @@ def submit_summary_feedback(request, pk):
 @require_POST
 @csrf_protect
 def approve_article_view(request, pk):
-    article = get_object_or_404(Article, pk=pk)
-    article.approved = True
-    article.save()
+    article = get_object_or_404(Article.objects.only('pk'), pk=pk)
+    set_approval([article.pk], approved=True)
     messages.success(request, "Article approved successfully.")
     return redirect('news:article_detail', pk=pk)
 
 # -----------------------------
-# 🔁 AJAX: GENERATE AUDIO ON-DEMAND
+# 📥 MODERATION QUEUE
 # -----------------------------
-@login_required
-@require_POST
-def generate_audio_ajax(request, pk):
-    article = get_object_or_404(Article, pk=pk)
+MODERATION_PAGE_SIZE = 50
 
-    if not article.summary:
-        article.summary = generate_summary(article.content, article.title)
-        article.save()
-        if not article.summary:
-            return JsonResponse({'status': 'error', 'message': 'Could not generate summary.'}, status=500)
 
-    audio_url = generate_audio_summary(article.summary, article.id)
+@staff_member_required
+def moderation_queue_view(request):
+    """Pending articles, oldest first, in keyset pages; POST approves or
+    rejects the ticked ones and returns to the same page."""
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        ids = [value for value in request.POST.getlist('ids') if value.isdigit()]
+        if action not in ('approve', 'reject') or not ids:
+            messages.error(request, "Select articles and an action.")
+        else:
+            updated = set_approval(ids, approved=action == 'approve')
+            pin_primary(request)
+            messages.success(request, f"{len(updated)} article(s) {'approved' if action == 'approve' else 'rejected'}.")
+        after = request.POST.get('after', '')
+        return redirect(f"{request.path}?after={after}" if after else request.path)
+
+    after, after_id = None, 0
+    cursor = request.GET.get('after', '')
+    if cursor:
+        try:
+            after, after_id = parse_watermark(cursor)
+        except (ValueError, OverflowError):
+            cursor = ''
+    page = pending_articles(after, after_id, limit=MODERATION_PAGE_SIZE)
+    return render(request, 'news/moderation_queue.html', {
+        'articles': page['articles'],
+        'next_cursor': page['next'],
+        'cursor': cursor,
+    })
 
-    if audio_url:
-        article.audio_file.name = audio_url.replace(settings.MEDIA_URL, '', 1)
-        article.save()
-        messages.success(request, "Audio summary generated!")
-        return JsonResponse({'status': 'success', 'audio_url': audio_url})
-    else:
-        messages.error(request, "Failed to generate audio summary.")
-        return JsonResponse({'status': 'error', 'message': 'Failed to generate audio'}, status=500)
+# -----------------------------
+# 📈 METRICS (Prometheus / JSON)
+# -----------------------------
+@require_GET
+def metrics_view(request):
+    """Prometheus text format for this process plus the latest run reports of
+    management commands (``?format=json`` for the raw snapshot). Staff or
+    INTERNAL_IPS only."""
+    if not (request.user.is_staff or request.META.get('REMOTE_ADDR') in settings.INTERNAL_IPS):
+        return HttpResponseForbidden()
+    snapshot = merge_snapshots(*latest_reports(), label_snapshot(REGISTRY.snapshot(), process='web'))
+    if request.GET.get('format') == 'json':
+        return JsonResponse(snapshot)
+    return HttpResponse(render_prometheus(snapshot), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# -----------------------------
+# ⏱️ SAMPLED REQUEST PROFILES
+# -----------------------------
+@staff_member_required
+def profiling_report(request):
+    """GET: per-view aggregate of sampled requests. POST: reset it."""
+    if request.method == 'POST':
+        profiling_aggregator.reset()
+        return JsonResponse({'status': 'reset'})
+    return JsonResponse({'sample_rate': settings.NEWS_PROFILING['SAMPLE_RATE'], **profiling_aggregator.report()})
@@ -1,6 +1,7 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView
 
 from users.Registration.registration import Registration
@@ -12,7 +13,9 @@ from news.models import UserPreference, ReadingHistory, Article  # ✅ Added Art
 # HOME PAGE VIEW (with articles)
 # -----------------------------
 def home(request):
-    articles = Article.objects.all().order_by('-published_date')[:6]  # Show latest 6 articles
+    articles = Article.objects.filter(approved=True).only(
+        'id', 'title', 'teaser'
+    ).order_by('-published_date')[:6]  # Show latest 6 approved articles
     return render(request, 'users/home.html', {'articles': articles})
 
 
@@ -53,7 +56,7 @@ def preferences(request):
 # -----------------------------
 # READING HISTORY VIEW
 # -----------------------------
-class ReadingHistoryListView(ListView):
+class ReadingHistoryListView(LoginRequiredMixin, ListView):
     model = ReadingHistory
     template_name = 'users/history.html'
     context_object_name = 'history'
@@ -62,4 +65,6 @@ class ReadingHistoryListView(ListView):
     def get_queryset(self):
         return ReadingHistory.objects.filter(
             user=self.request.user
-        ).select_related('article').order_by('-read_at')
+        ).select_related('article').only(
+            'read_at', 'article__id', 'article__title'
+        ).order_by('-read_at')